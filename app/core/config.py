@@ -35,6 +35,7 @@ class Settings:
     # OpenAI Configuration
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
     OPENAI_BASE_URL: str = "https://api.openai.com/v1"
+    OPENAI_MINI_MODEL: str = os.getenv("OPENAI_MINI_MODEL", "gpt-4o-mini")
     
     # Pinecone Configuration
     MOCK_PINECONE: bool = os.getenv("MOCK_PINECONE", "true").lower() == "true"
@@ -68,6 +69,8 @@ class Settings:
     # RAG Configuration
     CHUNK_SIZE: int = 1000
     CHUNK_OVERLAP: int = 200
+    UPSERT_BATCH_SIZE: int = 100
+    PINECONE_POOL_THREADS: int = 30
     RETRIEVAL_K: int = 7
 
 # Global settings instance
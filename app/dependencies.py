@@ -0,0 +1,28 @@
+"""
+Shared FastAPI dependencies for service singletons.
+Services are constructed lazily on first use instead of at module import,
+so cold starts (and health-check invocations) skip heavy client setup.
+"""
+from functools import lru_cache
+from .services.ai_service import get_ai_service
+from .services.vectorstore_service import VectorstoreService
+from .services.evaluation_service import EvaluationService
+from .services.data_transformation_service import DataTransformationService
+
+
+@lru_cache(maxsize=1)
+def get_vectorstore_service() -> VectorstoreService:
+    """Return the shared VectorstoreService instance."""
+    return VectorstoreService()
+
+
+@lru_cache(maxsize=1)
+def get_evaluation_service() -> EvaluationService:
+    """Return the shared EvaluationService instance."""
+    return EvaluationService(get_ai_service())
+
+
+@lru_cache(maxsize=1)
+def get_data_transformation_service() -> DataTransformationService:
+    """Return the shared DataTransformationService instance."""
+    return DataTransformationService()
@@ -1,12 +1,25 @@
 """
 Main FastAPI application entry point for AI Service.
 """
+import asyncio
+
+# Install uvloop before any event loop is created - the service is I/O-bound
+# on AI and vectorstore calls, so the loop scheduler cost matters directly
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
+import orjson
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
 from mangum import Mangum
 from .core.config import settings
+from .middleware import FastCORSMiddleware
 from .routes import cv_router, evaluation_router
-from .utils.debug import print_step
+from .utils.debug import logger, print_step
 
 def create_app() -> FastAPI:
     """
@@ -20,56 +33,80 @@ def create_app() -> FastAPI:
         title="CV Builder AI Service",
         version="1.0.0",
         description="AI Service for CV generation, evaluation, and recommendations",
-        debug=settings.DEBUG
+        debug=settings.DEBUG,
+        default_response_class=ORJSONResponse
     )
     
-    # Add CORS middleware
+    # Add CORS middleware - pure-ASGI handler, see app/middleware.py
+    # Origin set and header strings are computed once here so nothing is
+    # rebuilt per request: frozenset gives O(1) origin membership checks
     print_step("CORS Configuration", {"origins": settings.CORS_ORIGINS}, "input")
     app.add_middleware(
-        CORSMiddleware,
-        allow_origins=settings.ALL_CORS_ORIGINS,
+        FastCORSMiddleware,
+        allow_origins=frozenset(settings.ALL_CORS_ORIGINS),
         allow_credentials=True,
-        allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-        allow_headers=["Content-Type", "Authorization"],
+        allow_methods="GET, POST, PUT, DELETE, OPTIONS",
+        allow_headers="Content-Type, Authorization",
     )
+    # Compress large JSON responses - tailored CV payloads easily exceed
+    # 10KB and the round trip is dominated by body bytes; level 5 balances
+    # CPU cost against size
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
     print_step("FastAPI App Initialization", "FastAPI app and CORS middleware configured", "output")
     
     # Include routers with /ai prefix
     app.include_router(cv_router, prefix="/ai")
     app.include_router(evaluation_router, prefix="/ai")
     
+    # Static bodies serialized once at startup - health checks are polled
+    # constantly by load balancers, so skip per-request JSON encoding
+    root_body = orjson.dumps({"status": "CV Builder AI Service is online"})
+    health_body = orjson.dumps({"status": "healthy", "service": "ai-service"})
+
     # Root endpoint
     @app.get("/")
     def read_root():
-        return {"status": "CV Builder AI Service is online"}
-    
+        return Response(content=root_body, media_type="application/json")
+
     # Health check endpoint
     @app.get("/health")
     def health_check():
-        return {"status": "healthy", "service": "ai-service"}
-    
+        return Response(content=health_body, media_type="application/json")
+
     return app
 
 # Create the app instance
 app = create_app()
 
-# Create Mangum handler for AWS Lambda
-handler = Mangum(app)
+# Create Mangum handler for AWS Lambda - no startup/shutdown hooks are
+# registered, so skipping the ASGI lifespan protocol saves cold-start work
+handler = Mangum(app, lifespan="off")
+
+# On Lambda, pre-build the service singletons at init time so provisioned
+# (or freshly warmed) instances serve their first request without paying
+# for client construction. Failures are deferred to request time.
+if settings.IS_LAMBDA:
+    try:
+        from .dependencies import get_evaluation_service
+        get_evaluation_service()
+    except Exception as e:
+        print_step("Service Pre-warm", str(e), "error")
 
-# Application startup message
+# Application startup message - a single deferred log write instead of a
+# burst of synchronous print() calls during Lambda cold start
 print_step("Application Startup", "CV Builder AI Service is ready to serve requests!", "output")
-print("\n" + "="*80)
-print("🚀 CV BUILDER AI SERVICE STARTED SUCCESSFULLY")
-print("="*80)
-print("📋 Available Endpoints:")
-print("   • GET  /                    - Health check")
-print("   • GET  /health              - Health check")
-print("   • POST /ai/extract-cv-data  - Extract data from CV files")
-print("   • POST /ai/tailor-cv        - Tailor CV from text")
-print("   • POST /ai/tailor-cv-from-file - Tailor CV from uploaded file")
-print("   • POST /ai/evaluate-cv      - Perform committee evaluation on a generated CV")
-print("   • POST /ai/rephrase-section - Rephrase CV sections")
-print("   • POST /ai/get-template-recommendation - Get template recommendations")
-print("="*80)
-print("🔧 Debug Mode: ENABLED - Detailed logging will be shown for each request")
-print("="*80 + "\n")
\ No newline at end of file
+logger.info(
+    "\n" + "="*80 + "\n"
+    "🚀 CV BUILDER AI SERVICE STARTED SUCCESSFULLY\n"
+    + "="*80 + "\n"
+    "📋 Available Endpoints:\n"
+    "   • GET  /                    - Health check\n"
+    "   • GET  /health              - Health check\n"
+    "   • POST /ai/extract-cv-data  - Extract data from CV files\n"
+    "   • POST /ai/tailor-cv        - Tailor CV from text\n"
+    "   • POST /ai/tailor-cv-from-file - Tailor CV from uploaded file\n"
+    "   • POST /ai/evaluate-cv      - Perform committee evaluation on a generated CV\n"
+    "   • POST /ai/rephrase-section - Rephrase CV sections\n"
+    "   • POST /ai/get-template-recommendation - Get template recommendations\n"
+    + "="*80
+)
\ No newline at end of file
@@ -0,0 +1,78 @@
+"""
+Lightweight ASGI middleware for the CV Builder application.
+"""
+from typing import FrozenSet, List, Union
+
+
+class FastCORSMiddleware:
+    """
+    Minimal pure-ASGI CORS handler.
+
+    Starlette's CORSMiddleware allocates Request/Response wrappers around
+    every call; this service only needs a fixed origin set, fixed methods,
+    and fixed headers, so preflights are answered directly from precomputed
+    header tuples and normal responses just get the allow-origin header
+    appended.
+    """
+
+    def __init__(self, app, allow_origins: Union[List[str], FrozenSet[str]],
+                 allow_methods: Union[List[str], str],
+                 allow_headers: Union[List[str], str],
+                 allow_credentials: bool = True):
+        self.app = app
+        self.allow_origins = frozenset(origin.encode() for origin in allow_origins)
+
+        # Accept either a sequence or an already-joined CSV string so callers
+        # can precompute the header values once at startup
+        if not isinstance(allow_methods, str):
+            allow_methods = ", ".join(allow_methods)
+        if not isinstance(allow_headers, str):
+            allow_headers = ", ".join(allow_headers)
+
+        # Precompute the header tuples once - nothing here varies per request
+        self._preflight_headers = [
+            (b"access-control-allow-methods", allow_methods.encode()),
+            (b"access-control-allow-headers", allow_headers.encode()),
+            (b"access-control-max-age", b"600"),
+            (b"vary", b"Origin"),
+            (b"content-length", b"0"),
+        ]
+        self._simple_headers = [(b"vary", b"Origin")]
+        if allow_credentials:
+            credentials_header = (b"access-control-allow-credentials", b"true")
+            self._preflight_headers.append(credentials_header)
+            self._simple_headers.append(credentials_header)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+                break
+
+        if origin is None or origin not in self.allow_origins:
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS":
+            # Answer the preflight directly without touching the routers
+            await send({
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"access-control-allow-origin", origin)] + self._preflight_headers,
+            })
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                headers = message.setdefault("headers", [])
+                headers.append((b"access-control-allow-origin", origin))
+                headers.extend(self._simple_headers)
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
@@ -1,35 +1,42 @@
 """
 Request models for API endpoints.
 """
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Dict, Any
 
-class CVRequest(BaseModel):
+class StrictRequestModel(BaseModel):
+    """
+    Base for request models: frozen instances and no extra attributes keep
+    the per-request object graph small (no dynamic attribute allocation).
+    """
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+class CVRequest(StrictRequestModel):
     """CV tailoring request model."""
     job_description: str
     user_cv_text: str
 
-class ImageRequest(BaseModel):
+class ImageRequest(StrictRequestModel):
     """Image analysis request model."""
     image_base_64: str
 
-class EvaluationRequest(BaseModel):
+class EvaluationRequest(StrictRequestModel):
     """CV evaluation request model."""
     job_description: str
     cv_json: Dict[str, Any]
 
-class ExtractCVRequest(BaseModel):
+class ExtractCVRequest(StrictRequestModel):
     """CV extraction request model."""
     cv_text: str
     job_description: str
 
-class RephraseRequest(BaseModel):
+class RephraseRequest(StrictRequestModel):
     """CV section rephrase request model."""
     section_content: str
     section_type: str
     job_description: str
 
-class TemplateRecommendationRequest(BaseModel):
+class TemplateRecommendationRequest(StrictRequestModel):
     """Template recommendation request model."""
     job_description: str
     cv_data: Dict[str, Any]
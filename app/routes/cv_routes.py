@@ -1,28 +1,109 @@
 """
 CV-related API routes.
 """
-import json
+import asyncio
+import hashlib
 import os
-from fastapi import APIRouter, HTTPException, UploadFile, File
+import orjson
+from collections import OrderedDict
+from typing import List
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
 from ..models.request_models import CVRequest, ExtractCVRequest, RephraseRequest, TemplateRecommendationRequest
 from ..services.ai_service import AIService
 from ..services.vectorstore_service import VectorstoreService
 from ..services.evaluation_service import EvaluationService
 from ..services.data_transformation_service import DataTransformationService
+from ..core.config import settings
+from ..dependencies import (
+    get_ai_service, get_vectorstore_service, get_evaluation_service,
+    get_data_transformation_service
+)
 # File processing removed - using cloud-native approach
 from ..utils.security import validate_job_description, validate_cv_text
 from ..utils.debug import print_step
 
 router = APIRouter(prefix="/cv", tags=["CV"])
 
-# Initialize services
-ai_service = AIService()
-vectorstore_service = VectorstoreService()
-evaluation_service = EvaluationService(ai_service)
-data_transformation_service = DataTransformationService()
+# Bounded cache of retrieval results keyed by content hash - users iterate on
+# the same CV / job description pair across tailor and extract calls, and a
+# warm Lambda container keeps this dict alive across invocations, so repeat
+# submissions skip the embedding + similarity-search pipeline entirely
+_RETRIEVAL_CACHE_SIZE = 64
+_retrieval_cache: "OrderedDict[bytes, List]" = OrderedDict()
+
+# Namespaces this container has already indexed (16-byte hex digests, so the
+# set stays tiny for a container's lifetime); used to tell a query against
+# freshly upserted chunks from one against settled ones
+_indexed_namespaces: set = set()
+
+def _index_and_retrieve(vectorstore_service: VectorstoreService, cv_text: str,
+                        job_description: str) -> tuple:
+    """
+    Run the blocking vectorstore pipeline: chunk, index, retrieve.
+
+    Returns the retrieved documents and whether this was the first time the
+    container indexed this CV's namespace.
+    """
+    # Scope both the upsert and the query to a namespace derived from the CV
+    # content: the shared index holds chunks from every caller, and an
+    # unscoped query could surface another user's CV into this request's
+    # context. Hashing the text keeps the namespace stable across repeat
+    # submissions, so content-hash dedup still applies within it.
+    namespace = hashlib.blake2b(cv_text.encode(), digest_size=16).hexdigest()
+    first_index = namespace not in _indexed_namespaces
+    documents = vectorstore_service.create_documents(cv_text)
+    vectorstore_service.add_documents(documents, namespace=namespace)
+    _indexed_namespaces.add(namespace)
+    retrieved = vectorstore_service.retrieve_documents(job_description, namespace=namespace)
+    return retrieved, first_index
+
+async def _retrieve_context(vectorstore_service: VectorstoreService, cv_text: str,
+                            job_description: str) -> List:
+    """
+    Retrieve context documents for a CV / job description pair.
+
+    Results are cached by content hash so repeat submissions within a warm
+    container skip embedding and retrieval. Returns an empty list when the
+    vectorstore is not available (e.g. mock Pinecone).
+    """
+    if not vectorstore_service.vectorstore:
+        print_step("Document Retrieval",
+                   "Vectorstore unavailable - using raw CV text as context", "info")
+        return []
+
+    key = hashlib.blake2b(
+        (cv_text + "\x00" + job_description).encode(), digest_size=16
+    ).digest()
+    cached = _retrieval_cache.get(key)
+    if cached is not None:
+        _retrieval_cache.move_to_end(key)
+        print_step("Document Retrieval", "Cache hit - skipping embedding and retrieval", "info")
+        return cached
+
+    retrieved_docs, first_index = await asyncio.to_thread(
+        _index_and_retrieve, vectorstore_service, cv_text, job_description
+    )
+
+    # Serverless Pinecone is eventually consistent: the query straight after
+    # the first upsert of a CV can legitimately see none (or only some) of
+    # its chunks. Pinning such a result in the LRU would make every later
+    # submission of this pair evaluate with no context, so only cache
+    # results that are non-empty and either full or from settled chunks.
+    if retrieved_docs and not (first_index and len(retrieved_docs) < settings.RETRIEVAL_K):
+        _retrieval_cache[key] = retrieved_docs
+        if len(_retrieval_cache) > _RETRIEVAL_CACHE_SIZE:
+            _retrieval_cache.popitem(last=False)
+
+    return retrieved_docs
 
 @router.post("/tailor")
-async def tailor_cv(request: CVRequest):
+async def tailor_cv(
+    request: CVRequest,
+    ai_service: AIService = Depends(get_ai_service),
+    vectorstore_service: VectorstoreService = Depends(get_vectorstore_service),
+    evaluation_service: EvaluationService = Depends(get_evaluation_service),
+    data_transformation_service: DataTransformationService = Depends(get_data_transformation_service)
+):
     """
     Tailor a CV based on job description and user CV text.
     """
@@ -35,57 +116,62 @@ async def tailor_cv(request: CVRequest):
         "user_cv_text_length": len(validated_cv_text)
     }, "input")
 
-    # For now, skip vectorstore operations due to Lambda multiprocessing issues
-    # TODO: Implement alternative RAG approach or use different vectorstore
-    print_step("CV Tailoring", "Skipping vectorstore operations for Lambda compatibility", "info")
-    
-    # Use the original CV text directly as context
-    retrieved_context = validated_cv_text
-    
-    print_step("Document Retrieval", {
-        "retrieved_docs_count": 1,  # Using original CV text as single document
-        "retrieved_context_length": len(retrieved_context),
-        "retrieved_context_preview": retrieved_context[:200] + "..." if len(retrieved_context) > 200 else retrieved_context
-    }, "output")
-    
     try:
-        # Generate structured CV data using AI
-        raw_ai_data = await ai_service.extract_structured_cv_data(request.user_cv_text, request.job_description)
-        
+        # Retrieval and AI extraction have no data dependency, so overlap the
+        # two I/O-bound calls: wall clock becomes max() instead of sum()
+        retrieved_docs, raw_ai_data = await asyncio.gather(
+            _retrieve_context(vectorstore_service, validated_cv_text, validated_job_description),
+            ai_service.extract_structured_cv_data(validated_cv_text, validated_job_description)
+        )
+
+        # Only build the debug preview when it will actually be logged - joining
+        # all retrieved docs just to slice 200 chars is wasted work in production
+        if settings.DEBUG:
+            print_step("Document Retrieval", {
+                "retrieved_docs_count": len(retrieved_docs),
+                "retrieved_context_length": sum(len(doc.page_content) for doc in retrieved_docs),
+                "retrieved_context_preview": retrieved_docs[0].page_content[:200] + "..." if retrieved_docs else ""
+            }, "output")
+
         # Transform raw AI data to structured CVData model with enhanced dates
         cv_data = data_transformation_service.transform_ai_data_to_cv_data(raw_ai_data)
         
         # Convert back to dictionary for API response
         structured_content = data_transformation_service.cv_data_to_dict(cv_data)
         
-        # Debug: Show the actual generated content
-        print_step("Generated CV Content Preview", {
-            "name": structured_content.get("personal", {}).get("name", "NOT_FOUND"),
-            "contact_email": structured_content.get("personal", {}).get("email", "NOT_FOUND"),
-            "summary_length": len(structured_content.get("professional_summary", "")),
-            "experience_count": len(structured_content.get("experience", [])),
-            "education_count": len(structured_content.get("education", [])),
-            "skills_technical_count": len(structured_content.get("skills", {}).get("technical", [])) if structured_content.get("skills") else 0,
-            "has_enhanced_dates": any(
-                exp.get("startDateValue") or exp.get("endDateValue") 
-                for exp in structured_content.get("experience", [])
-            )
-        }, "output")
+        # Debug: Show the actual generated content. The dict of lookups and
+        # generator scans below is only built when DEBUG is on; `or {}` avoids
+        # allocating a fresh default dict on every missed key
+        if settings.DEBUG:
+            print_step("Generated CV Content Preview", {
+                "name": (structured_content.get("personal") or {}).get("name", "NOT_FOUND"),
+                "contact_email": (structured_content.get("personal") or {}).get("email", "NOT_FOUND"),
+                "summary_length": len(structured_content.get("professional_summary", "")),
+                "experience_count": len(structured_content.get("experience", [])),
+                "education_count": len(structured_content.get("education", [])),
+                "skills_technical_count": len((structured_content.get("skills") or {}).get("technical", [])),
+                "has_enhanced_dates": any(
+                    exp.get("startDateValue") or exp.get("endDateValue")
+                    for exp in structured_content.get("experience", [])
+                )
+            }, "output")
 
-        # Perform evaluation (without retrieved_docs for now)
+        # Perform evaluation - orjson is 2-5x faster than stdlib json on the
+        # multi-KB structured content blob
         evaluation_results = await evaluation_service.evaluate_cv_complete(
-            request.job_description,
-            json.dumps(structured_content),
-            []  # Empty list since we're not using vectorstore
+            validated_job_description,
+            orjson.dumps(structured_content).decode(),
+            retrieved_docs
         )
         
         # Add evaluation to structured content
         structured_content['analysis'] = evaluation_results
         
-        print_step("CV Tailoring Complete", {
-            "final_content_keys": list(structured_content.keys()),
-            "analysis_present": 'analysis' in structured_content
-        }, "output")
+        if settings.DEBUG:
+            print_step("CV Tailoring Complete", {
+                "final_content_keys": list(structured_content.keys()),
+                "analysis_present": 'analysis' in structured_content
+            }, "output")
         
         return structured_content
 
@@ -97,29 +183,38 @@ async def tailor_cv(request: CVRequest):
 # File uploads should be handled by the frontend and passed as text
 
 @router.post("/extract-cv-data")
-async def extract_cv_data(request: ExtractCVRequest):
+async def extract_cv_data(
+    request: ExtractCVRequest,
+    ai_service: AIService = Depends(get_ai_service),
+    vectorstore_service: VectorstoreService = Depends(get_vectorstore_service),
+    data_transformation_service: DataTransformationService = Depends(get_data_transformation_service)
+):
     """
     Extract structured CV data from text using AI.
     """
+    # Validate and sanitize inputs once; reuse the results everywhere below
+    validated_job_description = validate_job_description(request.job_description)
+    validated_cv_text = validate_cv_text(request.cv_text)
+
     print_step("CV Data Extraction Request", {
-        "cv_text_length": len(request.cv_text),
-        "job_description_length": len(request.job_description)
+        "cv_text_length": len(validated_cv_text),
+        "job_description_length": len(validated_job_description)
     }, "input")
 
     try:
-        # For now, skip vectorstore operations due to Lambda multiprocessing issues
-        print_step("CV Data Extraction", "Skipping vectorstore operations for Lambda compatibility", "info")
-        
-        # Use the original CV text directly as context
-        retrieved_context = request.cv_text
-        
-        print_step("Document Retrieval", {
-            "retrieved_docs_count": 1,  # Using original CV text as single document
-            "retrieved_context_length": len(retrieved_context)
-        }, "output")
-        
+        # Retrieve context documents (cached by content hash for repeat requests)
+        retrieved_docs = await _retrieve_context(
+            vectorstore_service, validated_cv_text, validated_job_description
+        )
+
+        if settings.DEBUG:
+            print_step("Document Retrieval", {
+                "retrieved_docs_count": len(retrieved_docs),
+                "retrieved_context_length": sum(len(doc.page_content) for doc in retrieved_docs)
+            }, "output")
+
         # Generate structured CV data using AI
-        raw_ai_data = await ai_service.extract_structured_cv_data(request.cv_text, request.job_description)
+        raw_ai_data = await ai_service.extract_structured_cv_data(validated_cv_text, validated_job_description)
         
         # Transform raw AI data to structured CVData model with enhanced dates
         cv_data = data_transformation_service.transform_ai_data_to_cv_data(raw_ai_data)
@@ -127,16 +222,17 @@ async def extract_cv_data(request: ExtractCVRequest):
         # Convert back to dictionary for API response
         structured_content = data_transformation_service.cv_data_to_dict(cv_data)
         
-        print_step("CV Data Extraction Complete", {
-            "extracted_keys": list(structured_content.keys()),
-            "name": structured_content.get("personal", {}).get("name", "NOT_FOUND"),
-            "experience_count": len(structured_content.get("experience", [])),
-            "education_count": len(structured_content.get("education", [])),
-            "has_enhanced_dates": any(
-                exp.get("startDateValue") or exp.get("endDateValue") 
-                for exp in structured_content.get("experience", [])
-            )
-        }, "output")
+        if settings.DEBUG:
+            print_step("CV Data Extraction Complete", {
+                "extracted_keys": list(structured_content.keys()),
+                "name": (structured_content.get("personal") or {}).get("name", "NOT_FOUND"),
+                "experience_count": len(structured_content.get("experience", [])),
+                "education_count": len(structured_content.get("education", [])),
+                "has_enhanced_dates": any(
+                    exp.get("startDateValue") or exp.get("endDateValue")
+                    for exp in structured_content.get("experience", [])
+                )
+            }, "output")
         
         return structured_content
 
@@ -145,7 +241,10 @@ async def extract_cv_data(request: ExtractCVRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/rephrase-section")
-async def rephrase_cv_section(request: RephraseRequest):
+async def rephrase_cv_section(
+    request: RephraseRequest,
+    ai_service: AIService = Depends(get_ai_service)
+):
     """
     Rephrase a specific CV section to better fit the target job.
     """
@@ -180,7 +279,10 @@ async def rephrase_cv_section(request: RephraseRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/recommend-template")
-async def recommend_template(request: TemplateRecommendationRequest):
+async def recommend_template(
+    request: TemplateRecommendationRequest,
+    ai_service: AIService = Depends(get_ai_service)
+):
     """
     Recommend the best CV template format based on job description and CV data.
     """
@@ -1,20 +1,20 @@
 """
 CV evaluation API routes.
 """
-from fastapi import APIRouter, HTTPException
+import json
+from fastapi import APIRouter, Depends, HTTPException
 from ..models.request_models import EvaluationRequest
 from ..services.evaluation_service import EvaluationService
-from ..services.ai_service import AIService
+from ..dependencies import get_evaluation_service
 from ..utils.debug import print_step
 
 router = APIRouter(prefix="/evaluation", tags=["Evaluation"])
 
-# Initialize services
-ai_service = AIService()
-evaluation_service = EvaluationService(ai_service)
-
 @router.post("/cv")
-async def evaluate_cv(request: EvaluationRequest):
+async def evaluate_cv(
+    request: EvaluationRequest,
+    evaluation_service: EvaluationService = Depends(get_evaluation_service)
+):
     """
     Perform a committee evaluation on a provided CV JSON against a job description.
     """
@@ -25,7 +25,6 @@ async def evaluate_cv(request: EvaluationRequest):
 
     try:
         # Convert the CV JSON object back to a string for the LLM prompt
-        import json
         cv_content_str = json.dumps(request.cv_json, indent=2)
 
         # Perform committee evaluation
@@ -2,11 +2,58 @@
 AI Service for handling OpenAI interactions.
 Follows Single Responsibility Principle - handles only AI-related operations.
 """
+import asyncio
+import json
 import os
-from typing import List, Dict, Any, Optional
-from openai import OpenAI
+import re
+from collections import defaultdict
+from functools import lru_cache
+import httpx
+from typing import AsyncIterator, List, Dict, Any, Optional
+import numpy as np
+import tiktoken
+from openai import AsyncOpenAI
 from ..core.config import settings
-from ..utils.debug import print_step
+from .embedding_cache import get_embedding_cache
+from .semantic_cache import SemanticCache
+from .vectorstore_service import _pack_embed_batches
+from ..utils.debug import logger
+
+# Precompiled career-heuristic patterns - word boundaries avoid false hits on
+# substrings (e.g. a company name containing "senior"), and one search per
+# title replaces repeated keyword-in-joined-string scans
+_SENIOR_RE = re.compile(r"\b(?:senior|lead|manager|director|principal|architect)\b", re.IGNORECASE)
+_JUNIOR_RE = re.compile(r"\b(?:junior|associate|assistant|intern|trainee)\b", re.IGNORECASE)
+
+# OpenAI only caches prompt prefixes of at least 1024 tokens; pad static
+# system prompts that fall short so they still benefit. Slightly above the
+# threshold to leave headroom for tokenizer drift.
+_PROMPT_CACHE_MIN_TOKENS = 1100
+
+# Stable, inert boilerplate appended to short system prompts until they cross
+# the caching threshold - it must never vary between calls
+_STYLE_GUIDE_SUFFIX = """
+            General style guide (applies to all CV writing):
+            - Write in clear, concise professional English without filler phrases.
+            - Prefer strong action verbs (led, built, delivered, optimized) over weak ones (helped, worked on).
+            - Quantify outcomes wherever the source content supports it (percentages, revenue, team size, latency).
+            - Keep bullet points parallel in structure and tense; use past tense for previous roles and present tense for current ones.
+            - Avoid first-person pronouns, buzzwords without substance, and unexplained abbreviations.
+            - Preserve all factual details from the source content; never invent employers, dates, titles, or metrics.
+            - Maintain consistent formatting for dates, locations, and company names throughout.
+            """
+
+# Single-pass role classification: token -> career bucket
+_ROLE_BUCKETS = {
+    "developer": "tech",
+    "engineer": "tech",
+    "manager": "management",
+    "director": "management",
+    "analyst": "analyst",
+    "consultant": "analyst",
+    "sales": "business",
+    "marketing": "business",
+}
 
 
 class AIService:
@@ -17,95 +64,45 @@ class AIService:
     
     def __init__(self):
         """Initialize the AI service with OpenAI client."""
+        self._build_prompt_templates()
         self._initialize_openai_client()
         self._initialize_embeddings()
+        # Semantic caches short-circuit the LLM round-trip for repeat and
+        # near-duplicate inputs
+        # Backpressure for outbound chat calls - an unbounded fan-out under
+        # request bursts trips OpenAI rate limits and the resulting retries
+        # cost more latency than briefly queueing here
+        self._sem = asyncio.Semaphore(int(os.getenv("OPENAI_MAX_INFLIGHT", "50")))
+        # Model tiers: short structured outputs (persona evaluation, template
+        # recommendation, rephrasing) are well within the mini model's reach
+        # at a fraction of the price and latency; generation and extraction
+        # keep the strong model
+        self.MODEL_CHEAP = settings.OPENAI_MINI_MODEL or "gpt-4o-mini"
+        self.MODEL_STRONG = "gpt-4o"
+        self._embedding_cache = get_embedding_cache()
+        self._extract_cache = SemanticCache()
+        # One semantic cache per persona: the persona name is only a few
+        # tokens of a multi-KB embedded key, so a shared nearest-neighbor
+        # search would return one persona's verdict for another's near-
+        # duplicate input
+        self._persona_caches: Dict[str, SemanticCache] = defaultdict(SemanticCache)
     
-    def _initialize_openai_client(self):
-        """Initialize OpenAI client."""
-        print_step("OpenAI Client Initialization", {"api_key_present": bool(settings.OPENAI_API_KEY)}, "input")
-        
-        if not settings.OPENAI_API_KEY:
-            raise ValueError("OpenAI API key is required")
-        
-        self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
-        print_step("OpenAI Client Initialization", "OpenAI client initialized successfully", "output")
-    
-    def _initialize_embeddings(self):
-        """Initialize embeddings model."""
-        print_step("Embeddings Initialization", {"api_key_present": bool(settings.OPENAI_API_KEY)}, "input")
-        
-        if not settings.OPENAI_API_KEY:
-            raise ValueError("OpenAI API key is required for embeddings")
-        
-        # Note: In a real implementation, you might want to use a separate embeddings client
-        # For now, we'll use the same client
-        print_step("Embeddings Initialization", "OpenAI embeddings initialized successfully", "output")
-    
-    async def generate_cv_from_text(self, job_description: str, user_experience: str) -> str:
-        """
-        Generate a tailored CV based on job description and user experience.
-        
-        Args:
-            job_description: The job description to tailor the CV for
-            user_experience: The user's experience and background
-            
-        Returns:
-            Generated CV content
-        """
-        try:
-            prompt = f"""
-            Based on the following job description and user experience, generate a tailored CV:
-            
-            Job Description:
-            {job_description}
-            
-            User Experience:
-            {user_experience}
-            
-            Please generate a professional CV that highlights relevant skills and experience.
-            """
-            
-            response = self.client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are a professional CV writer. Generate tailored CVs based on job descriptions."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=2000,
-                temperature=0.7
-            )
-            
-            return response.choices[0].message.content
-            
-        except Exception as e:
-            print(f"Error generating CV: {e}")
-            raise Exception(f"Failed to generate CV: {str(e)}")
-    
-    async def extract_structured_cv_data(self, cv_text: str, job_description: str) -> Dict[str, Any]:
+    def _build_prompt_templates(self):
         """
-        Extract structured CV data from text using AI.
-        
-        Args:
-            cv_text: The CV text to extract data from
-            job_description: The job description for context
-            
-        Returns:
-            Structured CV data as a dictionary
+        Build the static prompt templates once.
+
+        Each template is a frozen string, so every request reuses the exact
+        same bytes - a requirement for OpenAI's byte-exact prefix cache and
+        a saving on per-call multi-KB string construction.
         """
-        try:
-            prompt = f"""
-            Extract structured data from the following CV text and format it as JSON.
+        self._EXTRACT_SYS = """
+            You are an expert at extracting structured data from CVs. Always return valid JSON.
+            Extract structured data from the CV text provided by the user and format it as JSON.
             The job description is provided for context to help identify relevant information.
-            
-            Job Description:
-            {job_description}
-            
-            CV Text:
-            {cv_text}
-            
+
             Please extract and return the following information in JSON format:
-            {{
-                "personal": {{
+            {
+                "personal": {
                     "name": "Full name",
                     "email": "email@example.com",
                     "phone": "phone number",
@@ -113,10 +110,10 @@ class AIService:
                     "website": "website URL or empty string",
                     "linkedin": "LinkedIn URL or empty string",
                     "github": "GitHub URL or empty string"
-                }},
+                },
                 "professional_summary": "Brief professional summary",
                 "experience": [
-                    {{
+                    {
                         "role": "Job title",
                         "company": "Company name",
                         "startDate": "Start date (e.g., 'Jan 2023', '2023', 'Present')",
@@ -124,42 +121,42 @@ class AIService:
                         "location": "Job location",
                         "description": "Job description",
                         "achievements": ["achievement 1", "achievement 2"]
-                    }}
+                    }
                 ],
                 "education": [
-                    {{
+                    {
                         "degree": "Degree name",
                         "institution": "Institution name",
                         "field": "Field of study",
                         "startDate": "Start date (e.g., 'Sep 2020', '2020')",
                         "endDate": "End date (e.g., 'May 2023', '2023', 'Present')",
                         "gpa": "GPA if mentioned or empty string"
-                    }}
+                    }
                 ],
                 "projects": [
-                    {{
+                    {
                         "name": "Project name",
                         "description": "Project description",
                         "tech_stack": ["technology1", "technology2"],
                         "link": "Project URL or empty string",
                         "startDate": "Start date if available or null",
                         "endDate": "End date if available or null"
-                    }}
+                    }
                 ],
-                "skills": {{
+                "skills": {
                     "technical": ["skill1", "skill2"],
                     "soft": ["skill1", "skill2"],
                     "languages": ["language1", "language2"]
-                }},
+                },
                 "licenses_certifications": [
-                    {{
+                    {
                         "name": "Certification name",
                         "issuer": "Issuing organization",
                         "date": "Issue date (e.g., 'Jan 2023', '2023')",
                         "expiry": "Expiry date if applicable or null"
-                    }}
+                    }
                 ]
-            }}
+            }
             
             Important date formatting guidelines:
             - Use "Present" or "Current" for ongoing positions/education
@@ -169,73 +166,371 @@ class AIService:
             
             Return only the JSON object, no additional text.
             """
+
+        self._RECOMMEND_SYS = """
+            You are an expert CV consultant. Based on the job description and CV analysis provided by the user, recommend the best CV template format.
+
+            Available CV formats:
+            1. REVERSE-CHRONOLOGICAL: Traditional format focusing on work history in reverse chronological order. Best for candidates with solid, linear work history and clear career progression.
+            2. FUNCTIONAL: Skills-based format emphasizing abilities over work history. Best for career changers, those with employment gaps, or diverse non-linear career paths.
+            3. COMBINATION: Hybrid format combining skills emphasis with chronological work history. Best for experienced professionals who want to showcase specific skills while providing clear work history.
+            
+            Consider these factors:
+            - Job requirements and industry standards
+            - Candidate's career history and progression
+            - Presence of employment gaps or career changes
+            - Strength of technical skills vs work experience
+            - Industry expectations (e.g., tech vs traditional corporate)
+            
+            Return your recommendation in JSON format:
+            {
+                "recommended_template": "reverse-chronological|functional|combination",
+                "confidence_score": <number between 0-100>,
+                "reasoning": "<detailed explanation of why this format is best>",
+                "format_explanation": "<brief explanation of what this format emphasizes>",
+                "alternatives": [
+                    {
+                        "template": "template_name",
+                        "reason": "<why this could also work>"
+                    }
+                ]
+            }
+            """
+
+        rephrase_base_prompts = {
+            'professional_summary': "You are a professional CV writer. Rephrase this professional summary to better align with the target job requirements while maintaining authenticity.",
+            'experience': "You are a professional CV writer. Rephrase this work experience description to better highlight relevant skills and achievements for the target job.",
+            'project': "You are a professional CV writer. Rephrase this project description to better showcase relevant technical skills and impact for the target job.",
+            'education': "You are a professional CV writer. Rephrase this education section to better emphasize relevant coursework, achievements, or projects for the target job.",
+            'skills': "You are a professional CV writer. Rephrase and reorganize these skills to better match the target job requirements and highlight the most relevant ones first.",
+            'certification': "You are a professional CV writer. Rephrase this certification description to better emphasize its relevance to the target job."
+        }
+        rephrase_default = "You are a professional CV writer. Rephrase this CV section to better align with the target job requirements."
+
+        rephrase_instructions = """
+            Instructions:
+            1. Rephrase the content to better match the job requirements
+            2. Use action verbs and quantifiable achievements where possible
+            3. Highlight relevant technical skills and technologies mentioned in the job description
+            4. Maintain professional tone and authenticity
+            5. Keep the same length or slightly shorter
+            6. Focus on impact and results rather than just responsibilities
+            7. Use keywords from the job description naturally
+
+            Return only the rephrased content, no additional text or explanations.
+            """
+
+        self._REPHRASE_SYS = {
+            section_type: self._pad_to_cacheable(base_prompt + "\n" + rephrase_instructions)
+            for section_type, base_prompt in rephrase_base_prompts.items()
+        }
+        self._REPHRASE_SYS_DEFAULT = self._pad_to_cacheable(rephrase_default + "\n" + rephrase_instructions)
+
+    def _pad_to_cacheable(self, template: str) -> str:
+        """
+        Pad a static system prompt past the prompt-cache token threshold.
+
+        Short templates (the rephrase prompts in particular) would otherwise
+        silently miss OpenAI's >=1024-token prefix cache. Padding uses a
+        stable style-guide block so the prefix stays byte-identical.
+        """
+        try:
+            encoding = tiktoken.encoding_for_model("gpt-4o")
+        except Exception:
+            logger.exception("prompt_padding tokenizer unavailable - skipping")
+            return template
+
+        tokens = len(encoding.encode(template))
+        while tokens < _PROMPT_CACHE_MIN_TOKENS:
+            template += _STYLE_GUIDE_SUFFIX
+            tokens = len(encoding.encode(template))
+        logger.debug("prompt_padding final_tokens=%d", tokens)
+        return template
+
+    def _initialize_openai_client(self):
+        """Initialize OpenAI client."""
+        # Lazy %-formatting: the arguments are only rendered when DEBUG is on
+        logger.debug("openai_client_init api_key_present=%s", bool(settings.OPENAI_API_KEY))
+        
+        if not settings.OPENAI_API_KEY:
+            raise ValueError("OpenAI API key is required")
+        
+        # Large keep-alive pool so concurrent LLM calls never queue on
+        # connection acquisition; max_retries handles 429/5xx backoff
+        limits = httpx.Limits(max_connections=1000, max_keepalive_connections=1000)
+        http_client = httpx.AsyncClient(
+            limits=limits,
+            timeout=httpx.Timeout(60.0, connect=5.0)
+        )
+        self.client = AsyncOpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            http_client=http_client,
+            max_retries=5
+        )
+        logger.debug("openai_client_init done")
+    
+    def _initialize_embeddings(self):
+        """Initialize embeddings model."""
+        logger.debug("embeddings_init api_key_present=%s", bool(settings.OPENAI_API_KEY))
+        
+        if not settings.OPENAI_API_KEY:
+            raise ValueError("OpenAI API key is required for embeddings")
+        
+        # Note: In a real implementation, you might want to use a separate embeddings client
+        # For now, we'll use the same client
+        logger.debug("embeddings_init done")
+    
+    async def _chat(self, **kwargs):
+        """Issue a chat completion with bounded in-flight concurrency."""
+        async with self._sem:
+            return await self.client.chat.completions.create(**kwargs)
+
+    async def embed_batch(self, texts: List[str], model: str = "text-embedding-3-small") -> np.ndarray:
+        """
+        Embed a list of texts with batched API calls.
+
+        The embeddings endpoint accepts arrays of inputs, so sending one
+        request per batch instead of one per text bounds the cost at one
+        round-trip per ~2048 texts (or ~200k tokens, whichever comes first).
+
+        Args:
+            texts: Texts to embed
+            model: Embeddings model name
+
+        Returns:
+            Contiguous float32 matrix, one row per input text
+        """
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+
+        # Probe the shared content-addressed cache first and only send the
+        # misses to the API, merging results back in input order
+        rows_by_index: Dict[int, np.ndarray] = {}
+        miss_indices: List[int] = []
+        for index, text in enumerate(texts):
+            cached = self._embedding_cache.get(text, model)
+            if cached is not None:
+                rows_by_index[index] = cached
+            else:
+                miss_indices.append(index)
+
+        if miss_indices:
+            fresh = await self._embed_batch_uncached(
+                [texts[i] for i in miss_indices], model
+            )
+            for index, row in zip(miss_indices, fresh):
+                self._embedding_cache.put(texts[index], row, model)
+                rows_by_index[index] = row
+
+        return np.stack([rows_by_index[i] for i in range(len(texts))])
+
+    async def _embed_batch_uncached(self, texts: List[str], model: str) -> np.ndarray:
+        """Embed texts with batched API calls, bypassing the cache."""
+        # Same token/count-bounded packing as the vectorstore ingestion
+        # path, including its lazy tokenizer load and offline fallback
+        responses = await asyncio.gather(*[
+            self.client.embeddings.create(model=model, input=batch)
+            for batch in _pack_embed_batches(texts)
+        ])
+
+        rows = [item.embedding for response in responses for item in response.data]
+        return np.asarray(rows, dtype=np.float32)
+
+    async def _embed_for_cache(self, text: str) -> Optional[List[float]]:
+        """
+        Embed text for semantic cache lookups.
+
+        Returns:
+            Embedding vector, or None if the embeddings call fails (the
+            caller then falls back to exact-match caching only)
+        """
+        try:
+            matrix = await self.embed_batch([text])
+            return matrix[0].tolist()
+        except Exception:
+            logger.exception("semantic_cache_embedding failed")
+            return None
+
+    async def generate_cv_from_text(self, job_description: str, user_experience: str) -> AsyncIterator[str]:
+        """
+        Generate a tailored CV based on job description and user experience.
+        
+        Streams the completion so callers (e.g. a StreamingResponse handler)
+        can surface the first tokens in well under a second instead of
+        waiting out the full generation.
+        
+        Args:
+            job_description: The job description to tailor the CV for
+            user_experience: The user's experience and background
             
-            response = self.client.chat.completions.create(
-                model="gpt-4",
+        Yields:
+            Generated CV content chunks as they arrive
+        """
+        try:
+            system_prompt = (
+                "You are a professional CV writer. Generate tailored CVs based on job descriptions. "
+                "Based on the job description and user experience provided, generate a professional "
+                "CV that highlights relevant skills and experience."
+            )
+
+            user_prompt = f"Job Description:\n{job_description}\n\nUser Experience:\n{user_experience}"
+
+            stream = await self._chat(
+                model=self.MODEL_STRONG,
                 messages=[
-                    {"role": "system", "content": "You are an expert at extracting structured data from CVs. Always return valid JSON."},
-                    {"role": "user", "content": prompt}
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt}
                 ],
                 max_tokens=2000,
-                temperature=0.3
+                temperature=0.7,
+                stream=True
             )
             
-            # Parse the JSON response
-            import json
-            content = response.choices[0].message.content.strip()
+            async for chunk in stream:
+                yield chunk.choices[0].delta.content or ""
             
-            # Remove any markdown formatting if present
-            if content.startswith("```json"):
-                content = content[7:]
-            if content.endswith("```"):
-                content = content[:-3]
+        except Exception as e:
+            logger.exception("Error generating CV")
+            raise Exception(f"Failed to generate CV: {str(e)}")
+    
+    async def extract_structured_cv_data(self, cv_text: str, job_description: str) -> Dict[str, Any]:
+        """
+        Extract structured CV data from text using AI.
+        
+        Args:
+            cv_text: The CV text to extract data from
+            job_description: The job description for context
             
-            return json.loads(content)
+        Returns:
+            Structured CV data as a dictionary
+        """
+        cache_key = cv_text + "\n" + job_description
+        cached = self._extract_cache.get_exact(cache_key)
+        if cached is not None:
+            return cached
+
+        embedding = await self._embed_for_cache(cache_key)
+        if embedding is not None:
+            cached = self._extract_cache.get_semantic(embedding)
+            if cached is not None:
+                return cached
+
+        try:
+            # Static instructions live entirely in the system message and the
+            # variable inputs come last - OpenAI only caches exact shared
+            # prefixes, so keeping the big schema byte-identical across calls
+            # makes it cacheable
+            system_prompt = self._EXTRACT_SYS
+
+            user_prompt = f"Job Description:\n{job_description}\n\nCV Text:\n{cv_text}"
+
+            # JSON mode guarantees syntactically valid JSON - no markdown
+            # fences to strip and no fallback parse path
+            response = await self._chat(
+                model=self.MODEL_STRONG,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt}
+                ],
+                max_tokens=2000,
+                temperature=0.3,
+                response_format={"type": "json_object"}
+            )
+            
+            result = json.loads(response.choices[0].message.content)
+            self._extract_cache.put(cache_key, embedding, result)
+            return result
             
         except Exception as e:
-            print(f"Error extracting structured CV data: {e}")
+            logger.exception("Error extracting structured CV data")
             raise Exception(f"Failed to extract CV data: {str(e)}")
     
-    async def generate_cv_from_file(self, file_content: str, job_description: str) -> str:
+    async def generate_cv_from_file(self, file_content: str, job_description: str) -> AsyncIterator[str]:
         """
         Generate a tailored CV from uploaded file content.
         
+        Streams the completion chunks as they arrive; see
+        generate_cv_from_text.
+        
         Args:
             file_content: Content from uploaded file
             job_description: The job description to tailor the CV for
             
-        Returns:
-            Generated CV content
+        Yields:
+            Generated CV content chunks as they arrive
         """
         try:
-            prompt = f"""
-            Based on the following existing CV content and job description, generate an improved, tailored CV:
-            
-            Existing CV Content:
-            {file_content}
-            
-            Job Description:
-            {job_description}
-            
-            Please improve and tailor the CV to better match the job requirements.
-            """
-            
-            response = self.client.chat.completions.create(
-                model="gpt-4",
+            system_prompt = (
+                "You are a professional CV writer. Improve and tailor existing CVs based on job "
+                "descriptions. Based on the existing CV content and job description provided, "
+                "generate an improved, tailored CV that better matches the job requirements."
+            )
+
+            user_prompt = f"Existing CV Content:\n{file_content}\n\nJob Description:\n{job_description}"
+
+            stream = await self._chat(
+                model=self.MODEL_STRONG,
                 messages=[
-                    {"role": "system", "content": "You are a professional CV writer. Improve and tailor existing CVs based on job descriptions."},
-                    {"role": "user", "content": prompt}
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt}
                 ],
                 max_tokens=2000,
-                temperature=0.7
+                temperature=0.7,
+                stream=True
             )
             
-            return response.choices[0].message.content
+            async for chunk in stream:
+                yield chunk.choices[0].delta.content or ""
             
         except Exception as e:
-            print(f"Error generating CV from file: {e}")
+            logger.exception("Error generating CV from file")
             raise Exception(f"Failed to generate CV from file: {str(e)}")
-    
+
+    async def generate_and_extract(self, file_content: str, job_description: str) -> tuple:
+        """
+        Generate a tailored CV and extract its structured data in one call.
+
+        Callers that previously chained generate_cv_from_file and
+        extract_structured_cv_data paid two long completions over mostly
+        identical inputs; fusing them halves both input tokens and
+        round-trips.
+
+        Args:
+            file_content: Content from uploaded file
+            job_description: The job description to tailor the CV for
+
+        Returns:
+            Tuple of (cv_markdown, structured data dict)
+        """
+        try:
+            system_prompt = (
+                "You are a professional CV writer. Improve and tailor existing CVs based on job "
+                "descriptions, then extract the result as structured data. Always return valid "
+                "JSON with exactly two keys: \"cv_markdown\", the full tailored CV as markdown "
+                "text, and \"structured\", the tailored CV formatted per this schema:\n"
+                + self._EXTRACT_SYS
+            )
+
+            user_prompt = f"Existing CV Content:\n{file_content}\n\nJob Description:\n{job_description}"
+
+            response = await self._chat(
+                model=self.MODEL_STRONG,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt}
+                ],
+                max_tokens=4000,
+                temperature=0.5,
+                response_format={"type": "json_object"}
+            )
+
+            result = json.loads(response.choices[0].message.content)
+            return result.get("cv_markdown", ""), result.get("structured", {})
+
+        except Exception as e:
+            logger.exception("Error in fused generate-and-extract")
+            raise Exception(f"Failed to generate and extract CV: {str(e)}")
+
     async def evaluate_cv_with_committee(self, cv_content: str, job_description: str) -> Dict[str, Any]:
         """
         Evaluate CV using committee of AI personas.
@@ -248,56 +543,46 @@ class AIService:
             Evaluation results from multiple personas
         """
         try:
-            personas = [
-                {
-                    "name": "Technical Recruiter",
-                    "prompt": "You are a technical recruiter. Evaluate this CV for technical skills and experience relevant to the job."
-                },
-                {
-                    "name": "HR Manager", 
-                    "prompt": "You are an HR manager. Evaluate this CV for cultural fit, communication skills, and overall presentation."
-                },
-                {
-                    "name": "Hiring Manager",
-                    "prompt": "You are a hiring manager. Evaluate this CV for role-specific qualifications and potential for success."
-                }
-            ]
-            
-            evaluations = {}
-            
-            for persona in personas:
-                prompt = f"""
-                {persona['prompt']}
-                
-                Job Description:
-                {job_description}
-                
-                CV Content:
-                {cv_content}
-                
-                Please provide:
-                1. Overall score (1-10)
-                2. Strengths
-                3. Areas for improvement
-                4. Recommendation (Hire/Maybe/No)
-                """
-                
-                response = self.client.chat.completions.create(
-                    model="gpt-4",
-                    messages=[
-                        {"role": "system", "content": persona['prompt']},
-                        {"role": "user", "content": prompt}
-                    ],
-                    max_tokens=500,
-                    temperature=0.7
-                )
-                
-                evaluations[persona['name']] = response.choices[0].message.content
-            
-            return evaluations
+            # One multi-task request instead of three: the multi-KB CV + job
+            # description prefix is sent (and billed) once, a single RPM slot
+            # is consumed, and the result arrives in one round-trip
+            system_prompt = """
+            You are a hiring committee of three personas evaluating the same CV:
+            1. "Technical Recruiter": a technical recruiter evaluating the CV for technical skills and experience relevant to the job.
+            2. "HR Manager": an HR manager evaluating the CV for cultural fit, communication skills, and overall presentation.
+            3. "Hiring Manager": a hiring manager evaluating the CV for role-specific qualifications and potential for success.
+
+            For each persona provide:
+            1. Overall score (1-10)
+            2. Strengths
+            3. Areas for improvement
+            4. Recommendation (Hire/Maybe/No)
+
+            Return your response in JSON format, one key per persona:
+            {
+                "Technical Recruiter": {"score": <1-10>, "strengths": "...", "improvements": "...", "recommendation": "<Hire/Maybe/No>"},
+                "HR Manager": {"score": <1-10>, "strengths": "...", "improvements": "...", "recommendation": "<Hire/Maybe/No>"},
+                "Hiring Manager": {"score": <1-10>, "strengths": "...", "improvements": "...", "recommendation": "<Hire/Maybe/No>"}
+            }
+            """
+
+            user_prompt = f"Job Description:\n{job_description}\n\nCV Content:\n{cv_content}"
+
+            response = await self._chat(
+                model=self.MODEL_STRONG,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt}
+                ],
+                max_tokens=1500,
+                temperature=0.7,
+                response_format={"type": "json_object"}
+            )
+
+            return json.loads(response.choices[0].message.content)
             
         except Exception as e:
-            print(f"Error evaluating CV: {e}")
+            logger.exception("Error evaluating CV")
             raise Exception(f"Failed to evaluate CV: {str(e)}")
 
     async def evaluate_with_persona(self, persona: str, job_description: str, cv_content: str) -> Dict[str, Any]:
@@ -312,22 +597,31 @@ class AIService:
         Returns:
             Evaluation results from the specific persona
         """
+        persona_cache = self._persona_caches[persona]
+        cache_key = f"{persona}\x00{job_description}\x00{cv_content}"
+        cached = persona_cache.get_exact(cache_key)
+        if cached is not None:
+            return cached
+
+        embedding = await self._embed_for_cache(cache_key)
+        if embedding is not None:
+            cached = persona_cache.get_semantic(embedding)
+            if cached is not None:
+                return cached
+
         try:
-            prompt = f"""
-            You are {persona}. Evaluate this CV for the given job description.
-            
-            Job Description:
-            {job_description}
-            
-            CV Content:
-            {cv_content}
-            
+            # Persona leads and the static instructions follow - with a fixed
+            # persona set each variant is a stable, cacheable prompt prefix
+            system_prompt = f"""
+            You are {persona}. Provide detailed, professional CV evaluations.
+            Evaluate the CV provided by the user for the given job description.
+
             Please provide:
             1. Overall score (1-10)
             2. Strengths
             3. Areas for improvement
             4. Recommendation (Hire/Maybe/No)
-            
+
             Return your response in JSON format with the following structure:
             {{
                 "score": <number between 1-10>,
@@ -337,35 +631,26 @@ class AIService:
                 "reasoning": "<brief explanation of your evaluation>"
             }}
             """
-            
-            response = self.client.chat.completions.create(
-                model="gpt-4",
+
+            user_prompt = f"Job Description:\n{job_description}\n\nCV Content:\n{cv_content}"
+
+            response = await self._chat(
+                model=self.MODEL_CHEAP,
                 messages=[
-                    {"role": "system", "content": f"You are {persona}. Provide detailed, professional CV evaluations."},
-                    {"role": "user", "content": prompt}
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt}
                 ],
                 max_tokens=500,
-                temperature=0.7
+                temperature=0.7,
+                response_format={"type": "json_object"}
             )
             
-            content = response.choices[0].message.content.strip()
-            
-            # Try to parse JSON response
-            try:
-                import json
-                return json.loads(content)
-            except json.JSONDecodeError:
-                # If JSON parsing fails, return a structured response
-                return {
-                    "score": 7,  # Default score
-                    "strengths": "Evaluation completed",
-                    "improvements": "See detailed feedback",
-                    "recommendation": "Maybe",
-                    "reasoning": content
-                }
+            result = json.loads(response.choices[0].message.content)
+            persona_cache.put(cache_key, embedding, result)
+            return result
             
         except Exception as e:
-            print(f"Error evaluating CV with persona {persona}: {e}")
+            logger.exception("Error evaluating CV with persona %s", persona)
             return {
                 "score": 0,
                 "strengths": "Error in evaluation",
@@ -387,44 +672,20 @@ class AIService:
             Rephrased section content
         """
         try:
-            # Define section-specific prompts
-            section_prompts = {
-                'professional_summary': "You are a professional CV writer. Rephrase this professional summary to better align with the target job requirements while maintaining authenticity.",
-                'experience': "You are a professional CV writer. Rephrase this work experience description to better highlight relevant skills and achievements for the target job.",
-                'project': "You are a professional CV writer. Rephrase this project description to better showcase relevant technical skills and impact for the target job.",
-                'education': "You are a professional CV writer. Rephrase this education section to better emphasize relevant coursework, achievements, or projects for the target job.",
-                'skills': "You are a professional CV writer. Rephrase and reorganize these skills to better match the target job requirements and highlight the most relevant ones first.",
-                'certification': "You are a professional CV writer. Rephrase this certification description to better emphasize its relevance to the target job."
-            }
-            
-            base_prompt = section_prompts.get(section_type, "You are a professional CV writer. Rephrase this CV section to better align with the target job requirements.")
-            
-            prompt = f"""
-            {base_prompt}
-            
-            Job Description:
-            {job_description}
-            
-            Current {section_type.replace('_', ' ').title()} Content:
-            {section_content}
-            
-            Instructions:
-            1. Rephrase the content to better match the job requirements
-            2. Use action verbs and quantifiable achievements where possible
-            3. Highlight relevant technical skills and technologies mentioned in the job description
-            4. Maintain professional tone and authenticity
-            5. Keep the same length or slightly shorter
-            6. Focus on impact and results rather than just responsibilities
-            7. Use keywords from the job description naturally
-            
-            Return only the rephrased content, no additional text or explanations.
-            """
-            
-            response = self.client.chat.completions.create(
-                model="gpt-4",
+            # Static per section type: the precompiled template keeps the
+            # prompt prefix byte-identical across calls
+            system_prompt = self._REPHRASE_SYS.get(section_type, self._REPHRASE_SYS_DEFAULT)
+
+            user_prompt = (
+                f"Job Description:\n{job_description}\n\n"
+                f"Current {section_type.replace('_', ' ').title()} Content:\n{section_content}"
+            )
+
+            response = await self._chat(
+                model=self.MODEL_CHEAP,
                 messages=[
-                    {"role": "system", "content": base_prompt},
-                    {"role": "user", "content": prompt}
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt}
                 ],
                 max_tokens=800,
                 temperature=0.7
@@ -433,7 +694,7 @@ class AIService:
             return response.choices[0].message.content.strip()
             
         except Exception as e:
-            print(f"Error rephrasing CV section: {e}")
+            logger.exception("Error rephrasing CV section")
             raise Exception(f"Failed to rephrase CV section: {str(e)}")
 
     async def recommend_template(self, job_description: str, cv_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -456,12 +717,14 @@ class AIService:
             skills_strength = len(cv_data.get('skills', {}).get('technical', [])) + len(cv_data.get('skills', {}).get('soft', []))
             projects_count = len(cv_data.get('projects', []))
             
-            prompt = f"""
-            You are an expert CV consultant. Based on the job description and CV data, recommend the best CV template format.
-            
+            # Static catalogue and schema first (cacheable); the variable job
+            # description and CV analysis go in the user message
+            system_prompt = self._RECOMMEND_SYS
+
+            user_prompt = f"""
             Job Description:
             {job_description}
-            
+
             CV Analysis:
             - Experience entries: {experience_count}
             - Linear career progression: {has_linear_career}
@@ -469,57 +732,23 @@ class AIService:
             - Career change detected: {is_career_changer}
             - Skills strength: {skills_strength} total skills
             - Projects count: {projects_count}
-            
-            Available CV formats:
-            1. REVERSE-CHRONOLOGICAL: Traditional format focusing on work history in reverse chronological order. Best for candidates with solid, linear work history and clear career progression.
-            2. FUNCTIONAL: Skills-based format emphasizing abilities over work history. Best for career changers, those with employment gaps, or diverse non-linear career paths.
-            3. COMBINATION: Hybrid format combining skills emphasis with chronological work history. Best for experienced professionals who want to showcase specific skills while providing clear work history.
-            
-            Consider these factors:
-            - Job requirements and industry standards
-            - Candidate's career history and progression
-            - Presence of employment gaps or career changes
-            - Strength of technical skills vs work experience
-            - Industry expectations (e.g., tech vs traditional corporate)
-            
-            Return your recommendation in JSON format:
-            {{
-                "recommended_template": "reverse-chronological|functional|combination",
-                "confidence_score": <number between 0-100>,
-                "reasoning": "<detailed explanation of why this format is best>",
-                "format_explanation": "<brief explanation of what this format emphasizes>",
-                "alternatives": [
-                    {{
-                        "template": "template_name",
-                        "reason": "<why this could also work>"
-                    }}
-                ]
-            }}
             """
-            
-            response = self.client.chat.completions.create(
-                model="gpt-4",
+
+            response = await self._chat(
+                model=self.MODEL_CHEAP,
                 messages=[
-                    {"role": "system", "content": "You are an expert CV consultant with deep knowledge of different CV formats and their optimal use cases. Provide detailed, professional recommendations."},
-                    {"role": "user", "content": prompt}
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt}
                 ],
                 max_tokens=800,
-                temperature=0.3
+                temperature=0.3,
+                response_format={"type": "json_object"}
             )
             
-            content = response.choices[0].message.content.strip()
-            
-            # Parse JSON response
-            import json
-            if content.startswith("```json"):
-                content = content[7:]
-            if content.endswith("```"):
-                content = content[:-3]
-            
-            return json.loads(content)
+            return json.loads(response.choices[0].message.content)
             
         except Exception as e:
-            print(f"Error recommending template: {e}")
+            logger.exception("Error recommending template")
             # Return default recommendation
             return {
                 "recommended_template": "combination",
@@ -544,14 +773,8 @@ class AIService:
             return True
         
         # Simple heuristic: check if job titles show progression
-        titles = [job.get('role', '').lower() for job in experience]
-        
-        # Look for progression indicators
-        progression_keywords = ['senior', 'lead', 'manager', 'director', 'principal', 'architect']
-        junior_keywords = ['junior', 'associate', 'assistant', 'intern', 'trainee']
-        
-        has_senior_roles = any(keyword in ' '.join(titles) for keyword in progression_keywords)
-        has_junior_roles = any(keyword in ' '.join(titles) for keyword in junior_keywords)
+        has_senior_roles = any(_SENIOR_RE.search(job.get('role', '')) for job in experience)
+        has_junior_roles = any(_JUNIOR_RE.search(job.get('role', '')) for job in experience)
         
         return has_senior_roles and has_junior_roles
     
@@ -569,24 +792,27 @@ class AIService:
         if len(experience) < 2:
             return False
         
-        # Look for different industries or job functions
-        companies = [job.get('company', '').lower() for job in experience]
-        roles = [job.get('role', '').lower() for job in experience]
-        
-        # Simple heuristic: if roles are very different, it might be a career change
-        role_keywords = set()
-        for role in roles:
-            if 'developer' in role or 'engineer' in role:
-                role_keywords.add('tech')
-            elif 'manager' in role or 'director' in role:
-                role_keywords.add('management')
-            elif 'analyst' in role or 'consultant' in role:
-                role_keywords.add('analyst')
-            elif 'sales' in role or 'marketing' in role:
-                role_keywords.add('business')
+        # Simple heuristic: if roles fall into different career buckets, it
+        # might be a career change - tokenize each role once and classify by
+        # dict lookup instead of repeated substring scans
+        role_buckets = set()
+        for job in experience:
+            for token in job.get('role', '').lower().split():
+                bucket = _ROLE_BUCKETS.get(token)
+                if bucket:
+                    role_buckets.add(bucket)
+                    break
         
-        return len(role_keywords) > 1
+        return len(role_buckets) > 1
 
 
-# Global instance
-ai_service = AIService()
+@lru_cache(maxsize=1)
+def get_ai_service() -> AIService:
+    """
+    Return the shared AIService instance, constructing it on first use.
+
+    Import-time construction would fire the OpenAI client setup (and raise on
+    a missing API key) before the app even starts; lazy construction keeps
+    imports cheap and lets tests run without a key.
+    """
+    return AIService()
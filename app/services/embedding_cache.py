@@ -0,0 +1,78 @@
+"""
+Content-addressed cache for embedding vectors.
+Keyed by SHA-256 of (model, input text) with LRU eviction and a TTL, so
+repeatedly embedded CVs and popular job descriptions skip the embeddings
+API entirely after the first call.
+"""
+import hashlib
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional
+
+import numpy as np
+
+
+class EmbeddingCache:
+    """
+    Bounded TTL cache mapping input text to its embedding vector.
+
+    Entries are keyed by the SHA-256 digest of the text, evicted
+    least-recently-used past max_entries, and expire after ttl seconds so
+    a long-lived process does not serve embeddings from a retired model
+    deployment indefinitely.
+
+    Vectors are held quantized to uint8 with a per-vector scale/offset
+    (~1.5KB instead of ~12KB for a 1536-dim embedding), so a full cache
+    costs megabytes rather than a hundred of them. Callers always see
+    dequantized float32.
+    """
+
+    def __init__(self, max_entries: int = 10_000, ttl: float = 3600.0):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of vectors to keep
+            ttl: Seconds before a stored vector expires
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[bytes, tuple]" = OrderedDict()
+
+    @staticmethod
+    def key(text: str, model: str = "") -> bytes:
+        """Return the cache key for a (model, text) pair."""
+        return hashlib.sha256(f"{model}\x00{text}".encode()).digest()
+
+    def get(self, text: str, model: str = "") -> Optional[np.ndarray]:
+        """Return the cached vector for text, or None if absent or expired."""
+        key = self.key(text, model)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, quantized, scale, offset = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return quantized.astype(np.float32) * scale + offset
+
+    def put(self, text: str, vector: np.ndarray, model: str = "") -> None:
+        """Store a vector for text, evicting the oldest entry if full."""
+        row = np.asarray(vector, dtype=np.float32)
+        offset = float(row.min(initial=0.0))
+        scale = (float(row.max(initial=0.0)) - offset) / 255.0 or 1.0
+        quantized = np.round((row - offset) / scale).astype(np.uint8)
+
+        key = self.key(text, model)
+        self._entries[key] = (time.monotonic() + self.ttl, quantized, scale, offset)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+@lru_cache(maxsize=1)
+def get_embedding_cache() -> EmbeddingCache:
+    """Return the process-wide EmbeddingCache shared by all services."""
+    return EmbeddingCache()
@@ -0,0 +1,82 @@
+"""
+Semantic cache for AI responses.
+Two-level lookup: an exact-match LRU keyed by content hash, then a cosine
+similarity search over stored embeddings for near-duplicate inputs.
+"""
+import hashlib
+from collections import OrderedDict
+from typing import Any, List, Optional
+import numpy as np
+from ..utils.debug import print_step
+
+
+class SemanticCache:
+    """
+    Bounded cache mapping input text to an AI response.
+
+    Level 0 is an exact-match LRU on the SHA-256 of the input, which is
+    free to probe. Level 1 matches near-duplicate inputs (same CV with a
+    trivially edited job description, etc.) by cosine similarity of their
+    embeddings against a configurable threshold.
+    """
+
+    def __init__(self, max_entries: int = 128, similarity_threshold: float = 0.97):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries to keep
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+        """
+        self.max_entries = max_entries
+        self.similarity_threshold = similarity_threshold
+        self._exact: "OrderedDict[bytes, Any]" = OrderedDict()
+        self._embeddings: List[np.ndarray] = []
+        self._values: List[Any] = []
+
+    @staticmethod
+    def _hash(text: str) -> bytes:
+        return hashlib.sha256(text.encode()).digest()
+
+    def get_exact(self, text: str) -> Optional[Any]:
+        """Return the cached value for an exact input match, if any."""
+        key = self._hash(text)
+        value = self._exact.get(key)
+        if value is not None:
+            self._exact.move_to_end(key)
+        return value
+
+    def get_semantic(self, embedding: List[float]) -> Optional[Any]:
+        """Return the cached value for the nearest stored embedding, if close enough."""
+        if not self._embeddings:
+            return None
+
+        query = np.asarray(embedding, dtype=np.float32)
+        query /= np.linalg.norm(query) or 1.0
+
+        # Stored rows are already unit-normalized, so the dot product is the
+        # cosine similarity
+        similarities = np.stack(self._embeddings) @ query
+        best = int(np.argmax(similarities))
+        if similarities[best] >= self.similarity_threshold:
+            print_step("Semantic Cache", {
+                "similarity": float(similarities[best])
+            }, "info")
+            return self._values[best]
+        return None
+
+    def put(self, text: str, embedding: Optional[List[float]], value: Any) -> None:
+        """Store a value under both the exact key and, if given, its embedding."""
+        key = self._hash(text)
+        self._exact[key] = value
+        if len(self._exact) > self.max_entries:
+            self._exact.popitem(last=False)
+
+        if embedding is not None:
+            row = np.asarray(embedding, dtype=np.float32)
+            row /= np.linalg.norm(row) or 1.0
+            self._embeddings.append(row)
+            self._values.append(value)
+            if len(self._embeddings) > self.max_entries:
+                self._embeddings.pop(0)
+                self._values.pop(0)
@@ -2,189 +2,657 @@
 Vectorstore service for document storage and retrieval.
 Cloud-native implementation using Pinecone only.
 """
-from typing import List, Optional
-from langchain_pinecone import PineconeVectorStore
-from langchain_openai import OpenAIEmbeddings
-from langchain.text_splitter import RecursiveCharacterTextSplitter
-from langchain.schema import Document
+import asyncio
+import gzip
+import hashlib
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional
+
+import httpx
+import numpy as np
+import orjson
+import tiktoken
+from openai import AsyncOpenAI, OpenAI
 from pinecone import Pinecone as PineconeClient, ServerlessSpec
+
 from ..core.config import settings
 from ..utils.debug import print_step
+from .embedding_cache import get_embedding_cache
+
+EMBEDDING_MODEL = "text-embedding-ada-002"
+
+# Aggregate token budget per embeddings request; chunks are packed by token
+# count rather than a fixed chunk count, so short chunks fill requests
+# densely and long ones cannot overflow the API's input limit
+_MAX_TOKENS_PER_BATCH = 200_000
+_MAX_INPUTS_PER_BATCH = 2048
+
+_EMBED_ENCODING = None
+
+
+def _get_embed_encoding():
+    """
+    Lazily load the tokenizer. tiktoken fetches its BPE table over the
+    network on first use, so loading at import time would make module
+    import fail offline; callers fall back to a length heuristic when no
+    tokenizer is available.
+    """
+    global _EMBED_ENCODING
+    if _EMBED_ENCODING is None:
+        try:
+            _EMBED_ENCODING = tiktoken.encoding_for_model(EMBEDDING_MODEL)
+        except Exception:
+            _EMBED_ENCODING = False
+    return _EMBED_ENCODING or None
+
+# Embedding batches in the ingestion pipeline are deliberately smaller than
+# upsert batches - they hit different backends with different sweet spots
+_PIPELINE_EMBED_BATCH = 64
+
+# Candidate chunk-break offsets: end of a sentence or a line
+_BOUNDARY_RE = re.compile(r'[.\n]')
+_DOT_BYTE = ord('.')
+_NL_BYTE = ord('\n')
+
+
+def _batched(items: List, size: int) -> Iterator[List]:
+    """Yield successive fixed-size batches from a list."""
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _content_id(text: str) -> str:
+    """Content-addressed vector ID: identical chunks share an ID."""
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+def _pack_embed_batches(texts: List[str]) -> List[List[str]]:
+    """Pack texts into embedding batches bounded by token and input count."""
+    encoding = _get_embed_encoding()
+    batches: List[List[str]] = []
+    current: List[str] = []
+    current_tokens = 0
+    for text in texts:
+        # ~4 characters per token is a safe overestimate when offline
+        tokens = len(encoding.encode(text)) if encoding else max(1, len(text) // 4)
+        if current and (current_tokens + tokens > _MAX_TOKENS_PER_BATCH
+                        or len(current) >= _MAX_INPUTS_PER_BATCH):
+            batches.append(current)
+            current = []
+            current_tokens = 0
+        current.append(text)
+        current_tokens += tokens
+    if current:
+        batches.append(current)
+    return batches
+
+
+@dataclass
+class Document:
+    """A chunk of text plus its metadata."""
+    page_content: str
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
 
 class VectorstoreService:
     """Service for vectorstore operations."""
-    
+
     def __init__(self):
         """Initialize the vectorstore service."""
-        self.embeddings: Optional[OpenAIEmbeddings] = None
-        self.vectorstore: Optional[PineconeVectorStore] = None
-        self.text_splitter: RecursiveCharacterTextSplitter = None
+        self.client: Optional[OpenAI] = None
+        self._aclient: Optional[AsyncOpenAI] = None
+        self.vectorstore = None  # Pinecone index handle, None when unavailable
+        self._index_host: str = ""  # Data-plane host for the direct REST path
+        self._pinecone_http: Optional[httpx.Client] = None
+        self._embedding_cache = get_embedding_cache()
+        # Cap concurrent embeddings requests so large ingestions do not trip
+        # rate limits; the client's own retries handle any 429 that remains
+        self._embed_sem = asyncio.Semaphore(5)
         self._initialize_components()
-    
+
     def _initialize_components(self) -> None:
-        """Initialize embeddings, text splitter, and vectorstore."""
+        """Initialize the embeddings client and vectorstore."""
         # Initialize embeddings
         print_step("Embeddings Initialization", {
             "api_key_present": bool(settings.OPENAI_API_KEY)
         }, "input")
-        
+
         if settings.OPENAI_API_KEY:
-            self.embeddings = OpenAIEmbeddings(model="text-embedding-ada-002")
-            print_step("Embeddings Initialization", 
+            # Shared keep-alive pools: without them every embedding call can
+            # pay a fresh TLS handshake, which dwarfs the request itself
+            limits = httpx.Limits(max_connections=50, max_keepalive_connections=50)
+            self.client = OpenAI(
+                api_key=settings.OPENAI_API_KEY,
+                http_client=httpx.Client(limits=limits, timeout=30.0),
+                max_retries=5
+            )
+            self._aclient = AsyncOpenAI(
+                api_key=settings.OPENAI_API_KEY,
+                http_client=httpx.AsyncClient(limits=limits, timeout=30.0),
+                max_retries=5
+            )
+            print_step("Embeddings Initialization",
                       "OpenAI embeddings initialized successfully", "output")
         else:
-            print_step("Embeddings Initialization", 
+            print_step("Embeddings Initialization",
                       "OpenAI embeddings not available - API key required", "error")
-        
-        # Initialize text splitter
-        print_step("Text Splitter Setup", {
-            "chunk_size": settings.CHUNK_SIZE,
-            "chunk_overlap": settings.CHUNK_OVERLAP
-        }, "input")
-        
-        self.text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=settings.CHUNK_SIZE,
-            chunk_overlap=settings.CHUNK_OVERLAP
-        )
-        print_step("Text Splitter Setup", "Text splitter initialized", "output")
-        
+
         # Initialize vectorstore
         self._initialize_vectorstore()
-    
+
     def _initialize_vectorstore(self) -> None:
         """Initialize the vectorstore."""
         print_step("Vectorstore Initialization", {
-            "embeddings_available": self.embeddings is not None,
+            "embeddings_available": self.client is not None,
             "mock_pinecone": settings.MOCK_PINECONE
         }, "input")
-        
-        if not self.embeddings:
-            print_step("Vectorstore Initialization", 
+
+        if not self.client:
+            print_step("Vectorstore Initialization",
                       "Vectorstore not initialized - OpenAI API key required", "error")
             return
-        
+
         # Check if we should use mock Pinecone
         if settings.MOCK_PINECONE:
-            print_step("Vectorstore Initialization", 
+            print_step("Vectorstore Initialization",
                       "Using mock Pinecone - skipping real connection", "info")
             return
-        
+
         # Use real Pinecone in production
         self._initialize_pinecone()
-    
+
     def _initialize_pinecone(self) -> None:
         """Initialize Pinecone vectorstore."""
-        print_step("Vectorstore Initialization", 
+        print_step("Vectorstore Initialization",
                   "Connecting to production Pinecone", "info")
-        
-        # Configure Pinecone for Lambda environment (no multiprocessing)
-        pinecone_client = PineconeClient(
-            api_key=settings.PINECONE_API_KEY,
-            pool_threads=1  # Disable multiprocessing for Lambda
-        )
+
+        pinecone_client = PineconeClient(api_key=settings.PINECONE_API_KEY)
         existing_indexes = pinecone_client.list_indexes().names()
         print_step("Pinecone Index Check", {
             "existing_indexes": existing_indexes
         }, "info")
-        
+
         if settings.PINECONE_INDEX_NAME not in existing_indexes:
             print_step("Pinecone Index Creation", {
                 "index_name": settings.PINECONE_INDEX_NAME,
                 "dimension": 1536
             }, "input")
-            
+
             pinecone_client.create_index(
                 name=settings.PINECONE_INDEX_NAME,
                 dimension=1536,
                 metric='cosine',
                 spec=ServerlessSpec(cloud='aws', region='us-east-1')
             )
-            print_step("Pinecone Index Creation", 
+            print_step("Pinecone Index Creation",
                       f"Index '{settings.PINECONE_INDEX_NAME}' created successfully", "output")
-        
-        # Use the new langchain-pinecone package
-        self.vectorstore = PineconeVectorStore.from_existing_index(
-            index_name=settings.PINECONE_INDEX_NAME,
-            embedding=self.embeddings
+
+        # A thread pool (not multiprocessing, so Lambda-safe) lets chunked
+        # upserts run in parallel via async_req=True
+        self.vectorstore = pinecone_client.Index(
+            settings.PINECONE_INDEX_NAME,
+            pool_threads=settings.PINECONE_POOL_THREADS
         )
-        print_step("Vectorstore Initialization", 
+
+        # Upserts go straight to the data-plane REST endpoint with orjson
+        # serialization and a gzipped body - the SDK's stdlib JSON encoder
+        # dominates CPU for hundreds of 1536-float arrays
+        self._index_host = pinecone_client.describe_index(settings.PINECONE_INDEX_NAME).host
+        self._pinecone_http = httpx.Client(
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=50),
+            timeout=30.0,
+            headers={
+                "Api-Key": settings.PINECONE_API_KEY,
+                "Content-Type": "application/json",
+                "Content-Encoding": "gzip"
+            }
+        )
+        print_step("Vectorstore Initialization",
                   "Pinecone vectorstore connected", "output")
-    
+
+    def _split_text(self, text: str) -> List[str]:
+        """
+        Split text into overlapping chunks, preferring sentence and line
+        boundaries over hard cuts.
+
+        Args:
+            text: Text to split
+
+        Returns:
+            List of chunk strings
+        """
+        chunk_size = settings.CHUNK_SIZE
+        overlap = settings.CHUNK_OVERLAP
+        chunks: List[str] = []
+        start = 0
+        length = len(text)
+
+        # Precompute every boundary offset in one pass instead of
+        # rfind-scanning up to chunk_size characters on each iteration.
+        # For ASCII text (the overwhelmingly common case) byte offsets
+        # equal character offsets, so the scan runs as a single vectorized
+        # byte comparison; otherwise fall back to a regex pass whose
+        # offsets are codepoint-correct.
+        if text.isascii():
+            data = np.frombuffer(text.encode(), dtype=np.uint8)
+            boundaries = np.flatnonzero((data == _DOT_BYTE) | (data == _NL_BYTE)) + 1
+        else:
+            boundaries = np.fromiter(
+                (match.end() for match in _BOUNDARY_RE.finditer(text)),
+                dtype=np.int64
+            )
+
+        while start < length:
+            end = min(start + chunk_size, length)
+            if end < length and boundaries.size:
+                # Largest boundary that still fits in this chunk
+                candidate = int(np.searchsorted(boundaries, end, side='right')) - 1
+                if candidate >= 0 and boundaries[candidate] > start + 1:
+                    end = int(boundaries[candidate])
+
+            chunk = text[start:end].strip()
+            if chunk:
+                chunks.append(chunk)
+
+            if end >= length:
+                break
+            start = max(end - overlap, start + 1)
+
+        return chunks
+
+    def _get_embedding(self, text: str) -> List[float]:
+        """
+        Embed a single text (used for retrieval queries).
+
+        Goes through the shared content cache, so repeated queries - the
+        same job description checked against many candidates - skip the
+        embeddings API entirely.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Embedding vector
+        """
+        cached = self._embedding_cache.get(text, EMBEDDING_MODEL)
+        if cached is not None:
+            # The cache hands back an ndarray; the SDK query path only
+            # serializes plain lists
+            return cached.tolist()
+
+        response = self.client.embeddings.create(model=EMBEDDING_MODEL, input=text)
+        embedding = response.data[0].embedding
+        self._embedding_cache.put(text, embedding, EMBEDDING_MODEL)
+        return embedding
+
+    def _get_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed many texts with batched API calls.
+
+        The embeddings endpoint accepts arrays of inputs, so one request
+        per token-packed batch replaces one round-trip per chunk.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Embedding vectors, one per input text in order
+        """
+        # Probe the shared content-addressed cache first; repeated CV
+        # ingestion re-submits identical chunks, and only misses should pay
+        # for an API call. Misses are also deduplicated within the request:
+        # identical chunks (shared headers, boilerplate) are embedded once
+        # and the vector scattered to every position.
+        embeddings: List[Optional[List[float]]] = [None] * len(texts)
+        miss_positions: Dict[str, List[int]] = {}
+        for index, text in enumerate(texts):
+            cached = self._embedding_cache.get(text, EMBEDDING_MODEL)
+            if cached is not None:
+                embeddings[index] = cached.tolist()
+            else:
+                miss_positions.setdefault(text, []).append(index)
+
+        for batch in _pack_embed_batches(list(miss_positions)):
+            response = self.client.embeddings.create(
+                model=EMBEDDING_MODEL,
+                input=batch
+            )
+            for text, item in zip(batch, response.data):
+                self._embedding_cache.put(text, item.embedding, EMBEDDING_MODEL)
+                for index in miss_positions[text]:
+                    embeddings[index] = item.embedding
+
+        return embeddings
+
+    async def _aget_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+        """
+        Async variant of _get_embeddings_batch: batches are embedded
+        concurrently with asyncio.gather instead of sequentially, bounded
+        by a semaphore to stay under rate limits.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Embedding vectors, one per input text in order
+        """
+        embeddings: List[Optional[List[float]]] = [None] * len(texts)
+        miss_positions: Dict[str, List[int]] = {}
+        for index, text in enumerate(texts):
+            cached = self._embedding_cache.get(text, EMBEDDING_MODEL)
+            if cached is not None:
+                embeddings[index] = cached.tolist()
+            else:
+                miss_positions.setdefault(text, []).append(index)
+
+        async def embed(batch: List[str]) -> None:
+            async with self._embed_sem:
+                response = await self._aclient.embeddings.create(
+                    model=EMBEDDING_MODEL,
+                    input=batch
+                )
+            for text, item in zip(batch, response.data):
+                self._embedding_cache.put(text, item.embedding, EMBEDDING_MODEL)
+                for index in miss_positions[text]:
+                    embeddings[index] = item.embedding
+
+        await asyncio.gather(*[
+            embed(batch) for batch in _pack_embed_batches(list(miss_positions))
+        ])
+        return embeddings
+
+    async def aadd_documents(self, documents: List[Document],
+                             namespace: str = "") -> None:
+        """
+        Add documents to vectorstore without blocking the event loop.
+
+        Embedding and upserting run as a bounded producer-consumer
+        pipeline: upserts for early batches overlap with embedding calls
+        for later ones, and only a few batches of vectors are ever held
+        in memory at once.
+
+        Args:
+            documents: Documents to add
+            namespace: Pinecone namespace to upsert into
+        """
+        if not self.vectorstore:
+            raise ValueError("Vectorstore not initialized")
+
+        if settings.DEBUG:
+            print_step("Document Indexing", {
+                "document_count": len(documents)
+            }, "input")
+
+        documents = await asyncio.to_thread(self._filter_new, documents, namespace)
+        if not documents:
+            print_step("Document Indexing", "All chunks already indexed", "output")
+            return
+
+        queue: "asyncio.Queue[Optional[List[Dict[str, Any]]]]" = asyncio.Queue(maxsize=4)
+
+        async def produce() -> None:
+            for offset in range(0, len(documents), _PIPELINE_EMBED_BATCH):
+                batch = documents[offset:offset + _PIPELINE_EMBED_BATCH]
+                embeddings = await self._aget_embeddings_batch(
+                    [doc.page_content for doc in batch]
+                )
+                await queue.put(self._build_vectors(batch, embeddings))
+            await queue.put(None)
+
+        async def consume() -> None:
+            batch_size = settings.UPSERT_BATCH_SIZE
+            pending: List[Dict[str, Any]] = []
+            while (vectors := await queue.get()) is not None:
+                pending.extend(vectors)
+                while len(pending) >= batch_size:
+                    batch = pending[:batch_size]
+                    del pending[:batch_size]
+                    await asyncio.to_thread(self._upsert_batch, batch, namespace)
+            if pending:
+                await asyncio.to_thread(self._upsert_batch, pending, namespace)
+
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(produce())
+            tg.create_task(consume())
+
+        print_step("Document Indexing", "Documents added to vectorstore", "output")
+
     def create_documents(self, text: str) -> List[Document]:
         """
         Create documents from text.
-        
+
         Args:
             text: Text to split into documents
-            
+
         Returns:
             List of documents
         """
-        print_step("Document Creation", {
-            "text_length": len(text)
-        }, "input")
-        
-        docs = self.text_splitter.create_documents([text])
-        print_step("Document Creation", {
-            "document_count": len(docs),
-            "total_chunks": sum(len(doc.page_content) for doc in docs)
-        }, "output")
-        
+        if settings.DEBUG:
+            print_step("Document Creation", {
+                "text_length": len(text)
+            }, "input")
+
+        docs = [Document(page_content=chunk) for chunk in self._split_text(text)]
+        if settings.DEBUG:
+            print_step("Document Creation", {
+                "document_count": len(docs),
+                "total_chunks": sum(len(doc.page_content) for doc in docs)
+            }, "output")
+
         return docs
-    
-    def add_documents(self, documents: List[Document]) -> None:
+
+    def add_documents(self, documents: List[Document], namespace: str = "") -> None:
         """
         Add documents to vectorstore.
-        
+
         Args:
             documents: Documents to add
+            namespace: Pinecone namespace to upsert into
         """
         if not self.vectorstore:
             raise ValueError("Vectorstore not initialized")
-            
-        print_step("Document Indexing", {
-            "document_count": len(documents)
-        }, "input")
-        
-        self.vectorstore.add_documents(documents)
+
+        if settings.DEBUG:
+            print_step("Document Indexing", {
+                "document_count": len(documents)
+            }, "input")
+
+        documents = self._filter_new(documents, namespace)
+        if documents:
+            embeddings = self._get_embeddings_batch([doc.page_content for doc in documents])
+            self._upsert_vectors(self._build_vectors(documents, embeddings), namespace)
         print_step("Document Indexing", "Documents added to vectorstore", "output")
-    
-    def retrieve_documents(self, query: str, k: int = None) -> List[Document]:
+
+    def _filter_new(self, documents: List[Document],
+                    namespace: str = "") -> List[Document]:
+        """
+        Drop documents whose content already lives in the index.
+
+        Content-hash IDs make upserts idempotent, and one fetch on those
+        IDs lets re-submitted chunks skip both embedding and upsert.
+        """
+        unique: Dict[str, Document] = {}
+        for doc in documents:
+            unique.setdefault(_content_id(doc.page_content), doc)
+
+        try:
+            existing = set(
+                self.vectorstore.fetch(ids=list(unique), namespace=namespace).vectors
+            )
+        except Exception:
+            print_step("Document Indexing", "Fetch for dedup failed - indexing all chunks", "info")
+            existing = set()
+
+        kept = [doc for cid, doc in unique.items() if cid not in existing]
+        if settings.DEBUG and len(kept) < len(documents):
+            print_step("Document Indexing", {
+                "skipped_existing": len(documents) - len(kept)
+            }, "info")
+        return kept
+
+    def _build_vectors(self, documents: List[Document],
+                       embeddings: List[List[float]]) -> List[Dict[str, Any]]:
+        """Pair documents with their embeddings as Pinecone vector dicts."""
+        # float32 arrays serialize directly via OPT_SERIALIZE_NUMPY on the
+        # REST path; the SDK fallback needs plain lists. The REST check and
+        # metadata copy are kept out of dict-splat form so the hot loop does
+        # one copy and two assignments per vector, nothing more.
+        use_rest = bool(self._index_host)
+        vectors: List[Dict[str, Any]] = []
+        for doc, embedding in zip(documents, embeddings):
+            metadata = doc.metadata.copy()
+            metadata["text"] = doc.page_content
+            vectors.append({
+                "id": _content_id(doc.page_content),
+                "values": np.asarray(embedding, dtype=np.float32) if use_rest else embedding,
+                "metadata": metadata
+            })
+        return vectors
+
+    def _rest_upsert(self, vectors: List[Dict[str, Any]], namespace: str = "") -> None:
+        """Upsert one batch via the data-plane REST endpoint."""
+        payload = orjson.dumps(
+            {"vectors": vectors, "namespace": namespace},
+            option=orjson.OPT_SERIALIZE_NUMPY
+        )
+        response = self._pinecone_http.post(
+            f"https://{self._index_host}/vectors/upsert",
+            content=gzip.compress(payload, compresslevel=1)
+        )
+        response.raise_for_status()
+
+    def _upsert_batch(self, vectors: List[Dict[str, Any]], namespace: str = "") -> None:
+        """Upsert one batch, preferring the direct REST path."""
+        if self._index_host:
+            self._rest_upsert(vectors, namespace)
+        else:
+            self.vectorstore.upsert(vectors=vectors, namespace=namespace)
+
+    def _upsert_vectors(self, vectors: List[Dict[str, Any]],
+                        namespace: str = "") -> None:
+        """Upsert vectors in parallel batches."""
+        # Fire the batches in parallel and wait for all of them; one
+        # oversized serial upsert blocks end-to-end
+        batches = list(_batched(vectors, settings.UPSERT_BATCH_SIZE))
+        if len(batches) == 1:
+            self._upsert_batch(batches[0], namespace)
+            return
+        with ThreadPoolExecutor(
+            max_workers=min(len(batches), settings.PINECONE_POOL_THREADS)
+        ) as pool:
+            for result in pool.map(partial(self._upsert_batch, namespace=namespace),
+                                   batches):
+                pass
+
+    def retrieve_documents(self, query: str, k: int = None,
+                           namespace: str = "") -> List[Document]:
         """
         Retrieve documents from vectorstore.
-        
+
         Args:
             query: Search query
             k: Number of documents to retrieve
-            
+            namespace: Pinecone namespace to search
+
         Returns:
             Retrieved documents
         """
         if not self.vectorstore:
             raise ValueError("Vectorstore not initialized")
-            
+
         k = k or settings.RETRIEVAL_K
-        
-        print_step("Document Retrieval", {
-            "query": query,
-            "k": k
-        }, "input")
-        
-        retriever = self.vectorstore.as_retriever(search_kwargs={'k': k})
-        retrieved_docs = retriever.invoke(query)
-        
-        print_step("Document Retrieval", {
-            "retrieved_docs_count": len(retrieved_docs),
-            "retrieved_context_length": sum(len(doc.page_content) for doc in retrieved_docs),
-            "retrieved_context_preview": retrieved_docs[0].page_content[:200] + "..." if retrieved_docs else ""
-        }, "output")
-        
+
+        if settings.DEBUG:
+            print_step("Document Retrieval", {
+                "query": query,
+                "k": k
+            }, "input")
+
+        result = self.vectorstore.query(
+            vector=self._get_embedding(query),
+            top_k=k,
+            include_metadata=True,
+            namespace=namespace
+        )
+        retrieved_docs = self._matches_to_documents(result)
+
+        if settings.DEBUG:
+            print_step("Document Retrieval", {
+                "retrieved_docs_count": len(retrieved_docs),
+                "retrieved_context_length": sum(len(doc.page_content) for doc in retrieved_docs),
+                "retrieved_context_preview": retrieved_docs[0].page_content[:200] + "..." if retrieved_docs else ""
+            }, "output")
+
         return retrieved_docs
-    
+
+    def retrieve_documents_many(self, queries: List[str], k: int = None,
+                                namespace: str = "") -> List[List[Document]]:
+        """
+        Retrieve documents for several queries concurrently.
+
+        All query texts are embedded in one batched call and the Pinecone
+        reads fan out on the index's thread pool, so latency is one
+        round-trip instead of one per query.
+
+        Args:
+            queries: Search queries
+            k: Number of documents to retrieve per query
+            namespace: Pinecone namespace to search
+
+        Returns:
+            One list of retrieved documents per query, in input order
+        """
+        if not self.vectorstore:
+            raise ValueError("Vectorstore not initialized")
+
+        k = k or settings.RETRIEVAL_K
+
+        if settings.DEBUG:
+            print_step("Document Retrieval", {
+                "query_count": len(queries),
+                "k": k
+            }, "input")
+
+        embeddings = self._get_embeddings_batch(queries)
+        async_results = [
+            self.vectorstore.query(
+                vector=embedding,
+                top_k=k,
+                include_metadata=True,
+                namespace=namespace,
+                async_req=True
+            )
+            for embedding in embeddings
+        ]
+        results = [self._matches_to_documents(result.get()) for result in async_results]
+
+        if settings.DEBUG:
+            print_step("Document Retrieval", {
+                "retrieved_docs_count": sum(len(docs) for docs in results)
+            }, "output")
+
+        return results
+
+    @staticmethod
+    def _matches_to_documents(result) -> List[Document]:
+        """Convert a Pinecone query result into Documents."""
+        return [
+            Document(
+                page_content=match["metadata"].get("text", ""),
+                metadata={key: value for key, value in match["metadata"].items() if key != "text"}
+            )
+            for match in result["matches"]
+        ]
+
     def clear_vectorstore(self) -> None:
         """Clear all documents from vectorstore."""
         if not self.vectorstore:
             return
-            
-        print_step("Vectorstore Cleanup", 
+
+        print_step("Vectorstore Cleanup",
                   "Pinecone cleanup not supported in production", "info")
@@ -2,38 +2,52 @@
 Debug utilities for logging and debugging.
 """
 import json
+import logging
+import sys
 from typing import Any, Optional
 from ..core.config import settings
 
+# Configure a stdout logger once at import - log level is driven by
+# settings.DEBUG so production runs skip all debug formatting work
+logger = logging.getLogger("cv_builder")
+if not logger.handlers:
+    _handler = logging.StreamHandler(sys.stdout)
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(_handler)
+logger.setLevel(logging.DEBUG if settings.DEBUG else logging.INFO)
+
 def print_step(step_name: str, data: Optional[Any] = None, data_type: str = "info") -> None:
     """
-    Helper function to print formatted debug information.
-    
+    Helper function to log formatted debug information.
+
     Args:
         step_name: Name of the step being logged
         data: Data to log (optional)
         data_type: Type of data (input, output, error, info)
     """
-    if not settings.DEBUG:
+    if not logger.isEnabledFor(logging.DEBUG):
         return
-        
-    print(f"\n{'='*60}")
-    print(f"🔍 STEP: {step_name}")
-    print(f"{'='*60}")
-    
+
+    lines = [
+        f"\n{'='*60}",
+        f"🔍 STEP: {step_name}",
+        f"{'='*60}",
+    ]
+
     if data is not None:
         if data_type == "input":
-            print(f"📥 INPUT DATA:")
+            lines.append("📥 INPUT DATA:")
         elif data_type == "output":
-            print(f"📤 OUTPUT DATA:")
+            lines.append("📤 OUTPUT DATA:")
         elif data_type == "error":
-            print(f"❌ ERROR:")
+            lines.append("❌ ERROR:")
         else:
-            print(f"ℹ️  DATA:")
-        
+            lines.append("ℹ️  DATA:")
+
         if isinstance(data, (dict, list)):
-            print(json.dumps(data, indent=2, default=str))
+            lines.append(json.dumps(data, indent=2, default=str))
         else:
-            print(str(data))
-    
-    print(f"{'='*60}\n")
+            lines.append(str(data))
+
+    lines.append(f"{'='*60}\n")
+    logger.debug("\n".join(lines))
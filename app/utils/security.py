@@ -1,10 +1,38 @@
 """
 Security utilities for the CV Builder application.
 """
+import hashlib
 import re
+import threading
+from collections import OrderedDict
 from fastapi import HTTPException
 from ..utils.debug import print_step
 
+# Precompiled sanitization pattern - a single alternation scans the input
+# once instead of three separate passes, which matters for CV bodies up to
+# 100KB where each pass allocates a new string
+_SANITIZE_PATTERN = r'<script[^>]*>.*?</script>|javascript:|on\w+\s*='
+
+# Prefer Google RE2 when available - its DFA matches all alternatives in one
+# linear pass with no backtracking, which is noticeably faster on bulk CV text
+try:
+    import re2
+    _re2_options = re2.Options()
+    _re2_options.dot_nl = True
+    _SANITIZE_RE = re2.compile('(?i)' + _SANITIZE_PATTERN, options=_re2_options)
+except ImportError:
+    _SANITIZE_RE = re.compile(_SANITIZE_PATTERN, re.IGNORECASE | re.DOTALL)
+
+# Narrow pattern used only by the clean-input fast path below
+_ONEVENT_RE = re.compile(r'on\w+\s*=', re.IGNORECASE)
+
+# Bounded LRU cache of sanitized outputs keyed by content hash - users often
+# re-submit the same CV text across tailor/rephrase/recommend calls within a
+# warm Lambda container, so repeat submissions skip the regex pass entirely
+_SANITIZE_CACHE_SIZE = 256
+_SANITIZE_CACHE: "OrderedDict[bytes, str]" = OrderedDict()
+_SANITIZE_CACHE_LOCK = threading.Lock()
+
 def sanitize_user_input(text: str, max_length: int = 10000) -> str:
     """
     Sanitize user input to prevent XSS and injection attacks.
@@ -23,13 +51,30 @@ def sanitize_user_input(text: str, max_length: int = 10000) -> str:
     if len(text) > max_length:
         text = text[:max_length]
     
-    # Remove potentially dangerous characters
+    # Fast path: most CV text contains no HTML/script vectors at all, and the
+    # C-level substring scans are ~10x cheaper than running the regex
+    lower = text.lower()
+    if '<script' not in lower and 'javascript:' not in lower and not _ONEVENT_RE.search(text):
+        return text.strip()
+
+    # Check the content-hash cache before running the regex
+    digest = hashlib.blake2b(text.encode(), digest_size=16).digest()
+    with _SANITIZE_CACHE_LOCK:
+        cached = _SANITIZE_CACHE.get(digest)
+        if cached is not None:
+            _SANITIZE_CACHE.move_to_end(digest)
+            return cached
+
+    # Remove potentially dangerous characters in a single pass
     # This is a basic sanitization - consider using a proper HTML sanitizer
-    text = re.sub(r'<script[^>]*>.*?</script>', '', text, flags=re.IGNORECASE | re.DOTALL)
-    text = re.sub(r'javascript:', '', text, flags=re.IGNORECASE)
-    text = re.sub(r'on\w+\s*=', '', text, flags=re.IGNORECASE)
-    
-    return text.strip()
+    sanitized = _SANITIZE_RE.sub('', text).strip()
+
+    with _SANITIZE_CACHE_LOCK:
+        _SANITIZE_CACHE[digest] = sanitized
+        if len(_SANITIZE_CACHE) > _SANITIZE_CACHE_SIZE:
+            _SANITIZE_CACHE.popitem(last=False)
+
+    return sanitized
 
 def validate_job_description(job_description: str) -> str:
     """
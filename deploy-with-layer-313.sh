@@ -50,6 +50,10 @@ cd ..
 PACKAGE_SIZE=$(du -h ai-service-deployment-313.zip | cut -f1)
 echo "📊 Package size: $PACKAGE_SIZE"
 
+# Remove the staging directory so a stale copy of app/ can't end up in a
+# later build (duplicate module trees double cold-start import cost)
+rm -rf package/
+
 # Update function code
 echo "☁️ Updating Lambda function code..."
 aws lambda update-function-code \
@@ -57,6 +57,10 @@ cd ..
 
 echo "✅ Minimal deployment package created: ai-service-deployment-minimal.zip"
 
+# Remove the staging directory so a stale copy of app/ can't end up in a
+# later build (duplicate module trees double cold-start import cost)
+rm -rf package/
+
 # Deploy to AWS Lambda
 if command -v aws &> /dev/null; then
     echo "☁️ Deploying to AWS Lambda with layer..."
@@ -48,6 +48,10 @@ cd ..
 
 echo "✅ Deployment package created: ai-service-deployment.zip"
 
+# Remove the staging directory so a stale copy of app/ can't end up in a
+# later build (duplicate module trees double cold-start import cost)
+rm -rf package/
+
 # Deploy to AWS Lambda (requires AWS CLI to be configured)
 if command -v aws &> /dev/null; then
     echo "☁️ Deploying to AWS Lambda..."
@@ -72,6 +76,21 @@ if command -v aws &> /dev/null; then
             --region $REGION
     fi
     
+    # Optionally keep warm instances ready - provisioned concurrency is the
+    # highest-impact knob for sub-100ms cold starts on Lambda
+    if [ -n "$PROVISIONED_CONCURRENCY" ]; then
+        echo "🔥 Configuring provisioned concurrency ($PROVISIONED_CONCURRENCY)..."
+        VERSION=$(aws lambda publish-version \
+            --function-name $FUNCTION_NAME \
+            --region $REGION \
+            --query 'Version' --output text)
+        aws lambda put-provisioned-concurrency-config \
+            --function-name $FUNCTION_NAME \
+            --qualifier $VERSION \
+            --provisioned-concurrent-executions $PROVISIONED_CONCURRENCY \
+            --region $REGION
+    fi
+
     echo "✅ AI Service deployed successfully!"
     echo "🔗 Function ARN: arn:aws:lambda:$REGION:$ACCOUNT_ID:function:$FUNCTION_NAME"
 else
@@ -0,0 +1,162 @@
+"""
+Unit tests for AIService.
+All OpenAI traffic is mocked; the tests cover response parsing, error
+handling and the career heuristics.
+"""
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.services.ai_service import AIService
+
+# Shared payloads, built once per module instead of per test
+_JOB = "Backend engineer role."
+_EXTRACT_PAYLOAD = json.dumps({"personal": {"name": "John Doe"}})
+_TEMPLATE_PAYLOAD = json.dumps({
+    "recommended_template": "reverse-chronological",
+    "confidence_score": 90
+})
+_COMMITTEE_VERDICT = {"score": 8, "strengths": "solid", "improvements": "none",
+                      "recommendation": "Hire"}
+_COMMITTEE_PAYLOAD = json.dumps({
+    "Technical Recruiter": _COMMITTEE_VERDICT,
+    "HR Manager": _COMMITTEE_VERDICT,
+    "Hiring Manager": _COMMITTEE_VERDICT
+})
+
+
+class _APIError(RuntimeError):
+    """Sentinel failure injected into mocked client calls."""
+
+
+def _assert_called_once(mock) -> None:
+    """Cheap single-call check: plain count compare, no call-list formatting."""
+    assert mock.call_count == 1
+
+
+def _completion(content: str) -> SimpleNamespace:
+    """Build a minimal chat-completion response carrying one message."""
+    return SimpleNamespace(
+        choices=(SimpleNamespace(message=SimpleNamespace(content=content)),)
+    )
+
+
+@pytest.fixture
+def patched_create(ai_service):
+    """The chat completions entry point, patched to an AsyncMock."""
+    with patch.object(ai_service.client.chat.completions, "create",
+                      new_callable=AsyncMock) as mock_create:
+        yield mock_create
+
+
+@pytest.fixture
+def no_semantic_cache(ai_service):
+    """Disable semantic-cache embedding lookups for one test."""
+    with patch.object(ai_service, "_embed_for_cache",
+                      new_callable=AsyncMock, return_value=None):
+        yield
+
+
+@pytest.fixture(scope="module")
+def ai_service():
+    """
+    Shared AIService instance.
+
+    Module-scoped on purpose: one instance serves the whole module since
+    per-test patches of client methods undo themselves. The client
+    constructors are stubbed out so construction skips httpx/TLS setup
+    entirely; the patches only need to hold during construction.
+    """
+    with patch("app.services.ai_service.AsyncOpenAI"), \
+         patch("app.services.ai_service.httpx") , \
+         patch("app.services.ai_service.settings") as mock_settings:
+        mock_settings.OPENAI_API_KEY = "test-key"
+        mock_settings.OPENAI_MINI_MODEL = "gpt-4o-mini"
+        service = AIService()
+    return service
+
+
+@pytest.mark.parametrize("method,args,payload,expected", [
+    ("extract_structured_cv_data",
+     ("John Doe, software engineer since 2015.", _JOB),
+     _EXTRACT_PAYLOAD,
+     {"personal": {"name": "John Doe"}}),
+    ("rephrase_cv_section",
+     ("Managed some people.", "experience", _JOB),
+     "  Led a team of five engineers.  ",
+     "Led a team of five engineers."),
+    ("recommend_template",
+     (_JOB, {"experience": [{"title": "Software Engineer"}]}),
+     _TEMPLATE_PAYLOAD,
+     json.loads(_TEMPLATE_PAYLOAD)),
+])
+async def test_happy_path(ai_service, patched_create, no_semantic_cache,
+                          method, args, payload, expected):
+    """One body for the structurally identical happy-path tests."""
+    patched_create.return_value = _completion(payload)
+
+    result = await getattr(ai_service, method)(*args)
+
+    assert result == expected
+    _assert_called_once(patched_create)
+
+
+async def test_extract_structured_cv_data_error(ai_service, patched_create,
+                                                no_semantic_cache):
+    patched_create.side_effect = _APIError("API Error")
+
+    with pytest.raises(Exception) as excinfo:
+        await ai_service.extract_structured_cv_data(
+            "Jane Roe, data analyst.", "Analyst role."
+        )
+
+    assert "Failed to extract CV data" in str(excinfo.value)
+
+
+async def test_evaluate_with_persona_error_returns_default(ai_service, patched_create,
+                                                           no_semantic_cache):
+    patched_create.side_effect = _APIError("API Error")
+
+    result = await ai_service.evaluate_with_persona(
+        "a technical recruiter", "Backend role.", "CV content."
+    )
+
+    assert result["score"] == 0
+    assert result["recommendation"] == "No"
+
+
+async def test_evaluate_cv_with_committee_single_call(ai_service, patched_create):
+    patched_create.return_value = _completion(_COMMITTEE_PAYLOAD)
+
+    result = await ai_service.evaluate_cv_with_committee(
+        "CV content.", _JOB
+    )
+
+    # The committee is fused into a single request
+    _assert_called_once(patched_create)
+    assert result["HR Manager"]["score"] == 8
+
+
+def test_analyze_career_progression(ai_service):
+    experience = [
+        {"role": "Senior Software Engineer"},
+        {"role": "Junior Software Engineer"},
+    ]
+    assert ai_service._analyze_career_progression(experience) is True
+    # A single entry is trivially linear
+    assert ai_service._analyze_career_progression([{"role": "Engineer"}]) is True
+
+
+def test_detect_career_change(ai_service):
+    changed = [
+        {"role": "Marketing Lead"},
+        {"role": "Software Engineer"},
+    ]
+    stable = [
+        {"role": "Software Developer"},
+        {"role": "Software Engineer"},
+    ]
+    assert ai_service._detect_career_change(changed) is True
+    assert ai_service._detect_career_change(stable) is False
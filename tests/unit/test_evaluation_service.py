@@ -0,0 +1,89 @@
+"""
+Unit tests for EvaluationService.
+The AI service dependency is a spec mock; RAGAS paths are exercised
+through their unavailable fallback.
+"""
+from unittest.mock import Mock, patch
+
+import pytest
+
+from app.services.ai_service import AIService
+from app.services.evaluation_service import EvaluationService
+
+# Shared payloads, built once per module instead of per test
+_JOB = "Backend role."
+_CV_JSON = '{"personal": {"name": "John Doe"}}'
+_ZERO_RAGAS_SCORES = {
+    "faithfulness": 0.0,
+    "answer_relevancy": 0.0,
+    "context_precision": 0.0,
+    "context_recall": 0.0,
+}
+
+
+@pytest.fixture(scope="module")
+def _base_ai_mock():
+    # Building a spec mock walks the whole AIService class with inspect;
+    # do that once per module and reset state between tests instead.
+    # spec_set also refuses writes to attributes the real class lacks, so
+    # no unbounded child mocks get synthesized by a typo
+    return Mock(spec_set=AIService)
+
+
+@pytest.fixture
+def mock_ai_service(_base_ai_mock):
+    _base_ai_mock.reset_mock(return_value=True, side_effect=True)
+    return _base_ai_mock
+
+
+@pytest.fixture
+def evaluation_service(mock_ai_service):
+    return EvaluationService(mock_ai_service)
+
+
+async def test_evaluate_cv_with_committee(evaluation_service, mock_ai_service):
+    mock_ai_service.evaluate_with_persona.return_value = {
+        "score": 8, "recommendation": "Hire"
+    }
+
+    result = await evaluation_service.evaluate_cv_with_committee(
+        _JOB, _CV_JSON
+    )
+
+    assert result["average_score"] == 8.0
+    assert len(result["individual_evaluations"]) == mock_ai_service.evaluate_with_persona.call_count
+
+
+async def test_committee_ignores_invalid_scores(evaluation_service, mock_ai_service):
+    mock_ai_service.evaluate_with_persona.side_effect = [
+        {"score": 9},
+        {"score": float("nan")},
+        {"score": "broken"},
+    ]
+
+    result = await evaluation_service.evaluate_cv_with_committee(
+        _JOB, _CV_JSON
+    )
+
+    assert result["average_score"] == 3.0
+
+
+async def test_ragas_unavailable_returns_zero_scores(evaluation_service):
+    with patch("app.services.evaluation_service.RAGAS_AVAILABLE", False):
+        scores = await evaluation_service.evaluate_cv_with_ragas(
+            _JOB, _CV_JSON, []
+        )
+
+    assert scores == _ZERO_RAGAS_SCORES
+
+
+async def test_evaluate_cv_complete(evaluation_service, mock_ai_service):
+    mock_ai_service.evaluate_with_persona.return_value = {"score": 6}
+
+    with patch("app.services.evaluation_service.RAGAS_AVAILABLE", False):
+        result = await evaluation_service.evaluate_cv_complete(
+            _JOB, _CV_JSON, []
+        )
+
+    assert result["committee_evaluation"]["average_score"] == 6.0
+    assert result["ragas_scores"]["faithfulness"] == 0.0